@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-from functools import cache
 
 from matter_server.client import MatterClient
 from matter_server.client.exceptions import (
@@ -33,7 +32,6 @@ from .adapter import MatterAdapter
 from .addon import get_addon_manager
 from .api import async_register_api
 from .const import CONF_INTEGRATION_CREATED_ADDON, CONF_USE_ADDON, DOMAIN, LOGGER
-from .discovery import SUPPORTED_PLATFORMS
 from .helpers import (
     MatterEntryData,
     get_matter,
@@ -42,30 +40,41 @@ from .helpers import (
 )
 from .models import MatterDeviceInfo
 from .services import async_setup_services
+from .snapshot import async_remove_snapshot
 
 CONNECT_TIMEOUT = 10
 LISTEN_READY_TIMEOUT = 30
+# attempts (and delay between them) to reconnect to the server,
+# before falling back to reloading the config entry
+WARM_RECONNECT_ATTEMPTS = 3
+WARM_RECONNECT_DELAY = 2
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 
 @callback
-@cache
 def get_matter_device_info(
     hass: HomeAssistant, device_id: str
 ) -> MatterDeviceInfo | None:
     """Return Matter device info or None if device does not exist."""
     # Test hass.data[DOMAIN] to ensure config entry is set up
-    if not hass.data.get(DOMAIN, False) or not (
-        node := node_from_ha_device_id(hass, device_id)
-    ):
+    if not hass.data.get(DOMAIN, False):
         return None
 
-    return MatterDeviceInfo(
+    device_info_cache = get_matter(hass).device_info_cache
+    if (device_info := device_info_cache.get(device_id)) is not None:
+        return device_info
+
+    if not (node := node_from_ha_device_id(hass, device_id)):
+        return None
+
+    device_info = MatterDeviceInfo(
         unique_id=node.device_info.uniqueID,
         vendor_id=hex(node.device_info.vendorID),
         product_id=hex(node.device_info.productID),
     )
+    device_info_cache.set(device_id, node.node_id, device_info)
+    return device_info
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
@@ -121,7 +130,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     async def on_hass_stop(event: Event) -> None:
         """Handle incoming stop event from Home Assistant."""
-        await matter_client.disconnect()
+        # the client is replaced on a warm reconnect
+        if matter_entry_data := hass.data.get(DOMAIN, {}).get(entry.entry_id):
+            await matter_entry_data.adapter.matter_client.disconnect()
+        else:
+            await matter_client.disconnect()
 
     entry.async_on_unload(
         hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, on_hass_stop)
@@ -160,12 +173,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     matter = MatterAdapter(hass, matter_client, entry)
     hass.data[DOMAIN][entry.entry_id] = MatterEntryData(matter, listen_task)
 
-    await hass.config_entries.async_forward_entry_setups(entry, SUPPORTED_PLATFORMS)
+    # sets up (only) the platforms with discovered entities
     await matter.setup_nodes()
 
     # If the listen task is already failed, we need to raise ConfigEntryNotReady
     if listen_task.done() and (listen_error := listen_task.exception()) is not None:
-        await hass.config_entries.async_unload_platforms(entry, SUPPORTED_PLATFORMS)
+        await hass.config_entries.async_unload_platforms(
+            entry, matter.forwarded_platforms
+        )
         hass.data[DOMAIN].pop(entry.entry_id)
         try:
             await matter_client.disconnect()
@@ -194,15 +209,109 @@ async def _client_listen(
         if entry.state != ConfigEntryState.LOADED:
             raise
 
-    if not hass.is_stopping:
-        LOGGER.debug("Disconnected from server. Reloading integration")
-        hass.async_create_task(hass.config_entries.async_reload(entry.entry_id))
+    if hass.is_stopping:
+        return
+    if entry.state == ConfigEntryState.LOADED:
+        matter_entry_data: MatterEntryData = hass.data[DOMAIN][entry.entry_id]
+        if matter_entry_data.reconnecting:
+            # started by a reconnect attempt, which handles the failure
+            return
+        if await _async_warm_reconnect(hass, entry):
+            return
+    LOGGER.debug("Disconnected from server. Reloading integration")
+    hass.async_create_task(hass.config_entries.async_reload(entry.entry_id))
+
+
+async def _async_warm_reconnect(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Reconnect to the Matter server, keeping the adapter and its entities.
+
+    Returns False if the reconnect failed and the entry needs to be reloaded.
+    """
+    matter_entry_data: MatterEntryData = hass.data[DOMAIN][entry.entry_id]
+    matter_entry_data.reconnecting = True
+    matter_entry_data.adapter.async_mark_unavailable()
+    try:
+        return await _async_reconnect_client(hass, entry, matter_entry_data)
+    finally:
+        matter_entry_data.reconnecting = False
+
+
+async def _async_wait_listening(
+    init_ready: asyncio.Event, listen_task: asyncio.Task
+) -> bool:
+    """Wait until the client is listening, return False if listening failed."""
+    ready_task = asyncio.create_task(init_ready.wait())
+    try:
+        await asyncio.wait(
+            (ready_task, listen_task), return_when=asyncio.FIRST_COMPLETED
+        )
+    finally:
+        ready_task.cancel()
+    return init_ready.is_set()
+
+
+async def _async_reconnect_client(
+    hass: HomeAssistant, entry: ConfigEntry, matter_entry_data: MatterEntryData
+) -> bool:
+    """Connect a new client and rebind the adapter to it, in a few attempts.
+
+    The listen task of an attempt reports a failure back to this loop
+    (as the entry is reconnecting), so there is only one client at a time.
+    """
+    matter = matter_entry_data.adapter
+    previous_server_info = matter.matter_client.server_info
+    for attempt in range(WARM_RECONNECT_ATTEMPTS):
+        if attempt:
+            await asyncio.sleep(WARM_RECONNECT_DELAY)
+        LOGGER.debug("Disconnected from server. Reconnecting (attempt %s)", attempt + 1)
+        matter_client = MatterClient(
+            entry.data[CONF_URL], async_get_clientsession(hass)
+        )
+        init_ready = asyncio.Event()
+        listen_task: asyncio.Task | None = None
+        try:
+            async with asyncio.timeout(CONNECT_TIMEOUT):
+                await matter_client.connect()
+            listen_task = asyncio.create_task(
+                _client_listen(hass, entry, matter_client, init_ready)
+            )
+            async with asyncio.timeout(LISTEN_READY_TIMEOUT):
+                listening = await _async_wait_listening(init_ready, listen_task)
+        except (CannotConnect, InvalidServerVersion, TimeoutError) as err:
+            LOGGER.debug("Failed to reconnect to the Matter server: %s", err)
+            listening = False
+        except asyncio.CancelledError:
+            # the config entry is being unloaded
+            if listen_task is not None:
+                listen_task.cancel()
+            raise
+        if listen_task is None or not listening:
+            if listen_task is not None:
+                listen_task.cancel()
+            await matter_client.disconnect()
+            continue
+        server_info = matter_client.server_info
+        if (
+            previous_server_info is None
+            or server_info is None
+            or server_info.compressed_fabric_id
+            != previous_server_info.compressed_fabric_id
+        ):
+            # a different fabric means different (device) ids, start over
+            listen_task.cancel()
+            await matter_client.disconnect()
+            return False
+        matter.async_rebind_client(matter_client)
+        matter_entry_data.listen_task = listen_task
+        return True
+    return False
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    matter: MatterAdapter = hass.data[DOMAIN][entry.entry_id].adapter
     unload_ok = await hass.config_entries.async_unload_platforms(
-        entry, SUPPORTED_PLATFORMS
+        entry, matter.forwarded_platforms
     )
 
     if unload_ok:
@@ -224,6 +333,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Config entry is being removed."""
+    await async_remove_snapshot(hass, entry.entry_id)
 
     if not entry.data.get(CONF_INTEGRATION_CREATED_ADDON):
         return
@@ -2,26 +2,52 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, cast
+import asyncio
+from collections.abc import Callable
+import hashlib
+import time
+from typing import TYPE_CHECKING, Any, cast
 
 from chip.clusters import Objects as clusters
+from chip.clusters.Types import NullValue
 from matter_server.client.models.device_types import BridgedNode
-from matter_server.common.models import EventType, ServerInfoMessage
+from matter_server.common.helpers.util import create_attribute_path
+from matter_server.common.models import EventType, MatterNodeEvent, ServerInfoMessage
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, ID_TYPE_DEVICE_ID, ID_TYPE_SERIAL, LOGGER
-from .discovery import async_discover_entities
-from .helpers import get_device_id
+from .const import (
+    DOMAIN,
+    ID_TYPE_DEVICE_ID,
+    ID_TYPE_SERIAL,
+    LOGGER,
+)
+from .discovery import (
+    DISCOVERY_READS,
+    async_discover_entities,
+    async_load_platforms,
+    get_missing_platforms,
+    get_node_platforms,
+)
+from .helpers import (
+    MatterDeviceInfoCache,
+    MatterEventTrace,
+    get_device_id,
+)
+from .interview import MatterInterviewScheduler
+from .snapshot import MatterDiscoverySnapshot
 
 if TYPE_CHECKING:
     from matter_server.client import MatterClient
     from matter_server.client.models.node import MatterEndpoint, MatterNode
 
+    from .entity import MatterEntity
+    from .models import MatterEntityInfo
+
 
 def get_clean_name(name: str | None) -> str | None:
     """Strip spaces and null char from the name."""
@@ -31,6 +57,67 @@ def get_clean_name(name: str | None) -> str | None:
     return name.strip() or None
 
 
+# platform, primary cluster_id, primary attribute_id, entity description key
+type DiscoveryKey = tuple[Platform, int, int, str]
+
+DEVICE_TYPE_LIST_ATTRIBUTE = (
+    clusters.Descriptor.Attributes.DeviceTypeList.cluster_id,
+    clusters.Descriptor.Attributes.DeviceTypeList.attribute_id,
+)
+
+
+def get_endpoint_fingerprints(node: MatterNode) -> dict[int, int]:
+    """Return a fingerprint of the discovery inputs of each endpoint of the node.
+
+    The fingerprint only covers what the discovery schemas (of the loaded
+    platforms) read of the endpoint: the presence of the attributes they
+    match on, whether the required ones are null, the values matched by
+    their value filters, the presence of the absent clusters on the node,
+    the device types and the vendor/product info, which together determine
+    the outcome of discovery for the endpoint. It is stable across restarts,
+    so it can be persisted (see the discovery snapshot).
+    """
+    attributes = node.node_data.attributes
+    fingerprints: dict[int, int] = {}
+    for endpoint_id, endpoint in node.endpoints.items():
+        device_info = endpoint.device_info
+        inputs: list[Any] = [
+            repr(
+                attributes.get(
+                    create_attribute_path(endpoint_id, *DEVICE_TYPE_LIST_ATTRIBUTE)
+                )
+            ),
+            device_info.vendorID,
+            device_info.productID,
+            device_info.productName,
+        ]
+        for cluster_id in sorted(endpoint.clusters):
+            if (reads := DISCOVERY_READS.get(cluster_id)) is None:
+                continue
+            inputs.append(cluster_id)
+            inputs.extend(
+                create_attribute_path(endpoint_id, *key) in attributes
+                for key in reads.present
+            )
+            inputs.extend(
+                attributes.get(create_attribute_path(endpoint_id, *key))
+                in (None, NullValue)
+                for key in reads.non_null
+            )
+            inputs.extend(
+                repr(attributes.get(create_attribute_path(endpoint_id, *key)))
+                for key in reads.values
+            )
+            inputs.extend(
+                node.has_cluster(absent_cluster_id)
+                for absent_cluster_id in reads.node_clusters
+            )
+        # not using hash() as that is randomized per process for strings
+        digest = hashlib.blake2b(repr(inputs).encode(), digest_size=8).digest()
+        fingerprints[endpoint_id] = int.from_bytes(digest)
+    return fingerprints
+
+
 class MatterAdapter:
     """Connect Matter into Home Assistant."""
 
@@ -45,101 +132,453 @@ class MatterAdapter:
         self.hass = hass
         self.config_entry = config_entry
         self.platform_handlers: dict[Platform, AddEntitiesCallback] = {}
-        self.discovered_entities: set[str] = set()
+        # only the platforms with discovered entities are set up,
+        # entities wait here until their platform registered its handler
+        self.forwarded_platforms: set[Platform] = set()
+        self._pending_entities: dict[Platform, list[MatterEntity]] = {}
+        # all per-endpoint state is indexed by node_id -> endpoint_id,
+        # so it can be dropped when the endpoint or node is removed
+        # entities created for the endpoint, by discovery key
+        self.discovered_entities: dict[
+            int, dict[int, dict[DiscoveryKey, MatterEntity]]
+        ] = {}
+        # discovery input fingerprint of the endpoint at the last discovery run
+        self._endpoint_fingerprints: dict[int, dict[int, int]] = {}
+        # last device registry entry data of the endpoint
+        self._device_registry_data: dict[int, dict[int, dict[str, Any]]] = {}
+        # HA device id of the endpoint
+        self._endpoint_device_ids: dict[int, dict[int, str]] = {}
+        # reverse index: HA device id -> (node_id, endpoint_id)
+        self._device_id_index: dict[str, tuple[int, int]] = {}
+        self.device_info_cache = MatterDeviceInfoCache()
+        # event router for the entities: (node_id, attribute_path) -> callbacks
+        # so every attribute report is dispatched with a single dict lookup
+        self._attribute_subscribers: dict[tuple[int, str], list[Callable]] = {}
+        self._node_subscribers: dict[int, list[Callable]] = {}
+        # node events are routed per (node_id, endpoint_id)
+        self._node_event_subscribers: dict[tuple[int, int], list[Callable]] = {}
+        self.event_trace = MatterEventTrace()
+        self.interview_scheduler = MatterInterviewScheduler(hass, matter_client)
+        self._client_unsubscribes: list[Callable[[], None]] = []
+        self.discovery_snapshot = MatterDiscoverySnapshot()
+
+    @callback
+    def get_device_id_location(self, device_id: str) -> tuple[int, int] | None:
+        """Return (node_id, endpoint_id) for a HA device id (without type prefix)."""
+        return self._device_id_index.get(device_id)
 
     def register_platform_handler(
         self, platform: Platform, add_entities: AddEntitiesCallback
     ) -> None:
         """Register a platform handler."""
         self.platform_handlers[platform] = add_entities
+        if pending_entities := self._pending_entities.pop(platform, None):
+            add_entities(pending_entities)
 
-    async def setup_nodes(self) -> None:
-        """Set up all existing nodes and subscribe to new nodes."""
-        for node in self.matter_client.get_nodes():
-            self._setup_node(node)
+    @callback
+    def subscribe_attribute_events(
+        self,
+        callback: Callable[[EventType, Any], None],
+        node_id: int,
+        attribute_path: str,
+    ) -> Callable[[], None]:
+        """Subscribe to ATTRIBUTE_UPDATED events for a single attribute path."""
+        return self._add_subscriber(
+            self._attribute_subscribers, (node_id, attribute_path), callback
+        )
+
+    @callback
+    def subscribe_node_events(
+        self,
+        callback: Callable[[EventType, Any], None],
+        node_id: int,
+    ) -> Callable[[], None]:
+        """Subscribe to NODE_UPDATED events for a single node."""
+        return self._add_subscriber(self._node_subscribers, node_id, callback)
+
+    @callback
+    def subscribe_node_event_events(
+        self,
+        callback: Callable[[EventType, MatterNodeEvent], None],
+        node_id: int,
+        endpoint_id: int,
+    ) -> Callable[[], None]:
+        """Subscribe to NODE_EVENT events for a single endpoint."""
+        return self._add_subscriber(
+            self._node_event_subscribers, (node_id, endpoint_id), callback
+        )
 
-        def node_added_callback(event: EventType, node: MatterNode) -> None:
-            """Handle node added event."""
-            self._setup_node(node)
+    @staticmethod
+    def _add_subscriber[_K](
+        subscribers: dict[_K, list[Callable]], key: _K, callback: Callable
+    ) -> Callable[[], None]:
+        """Add a callback to the given router and return its unsubscribe."""
+        subscribers.setdefault(key, []).append(callback)
 
-        def node_updated_callback(event: EventType, node: MatterNode) -> None:
-            """Handle node updated event."""
-            if not node.available:
+        def unsubscribe() -> None:
+            """Remove the callback from the router."""
+            if (key_subscribers := subscribers.get(key)) is None:
                 return
-            # We always run the discovery logic again,
-            # because the firmware version could have been changed or features added.
-            self._setup_node(node)
+            key_subscribers.remove(callback)
+            if not key_subscribers:
+                del subscribers[key]
 
-        def endpoint_added_callback(event: EventType, data: dict[str, int]) -> None:
-            """Handle endpoint added event."""
-            node = self.matter_client.get_node(data["node_id"])
-            self._setup_endpoint(node.endpoints[data["endpoint_id"]])
+        return unsubscribe
 
-        def endpoint_removed_callback(event: EventType, data: dict[str, int]) -> None:
-            """Handle endpoint removed event."""
-            server_info = cast(ServerInfoMessage, self.matter_client.server_info)
-            try:
-                node = self.matter_client.get_node(data["node_id"])
-            except KeyError:
-                return  # race condition
-            device_registry = dr.async_get(self.hass)
-            endpoint = node.endpoints.get(data["endpoint_id"])
-            if not endpoint:
-                return  # race condition
-            node_device_id = get_device_id(
-                server_info,
-                node.endpoints[data["endpoint_id"]],
+    @callback
+    def _on_attribute_updated(
+        self, event: EventType, data: tuple[int, str, Any]
+    ) -> None:
+        """Route an attribute update to the callbacks watching its path."""
+        node_id, attribute_path, _ = data
+        if subscribers := self._attribute_subscribers.get((node_id, attribute_path)):
+            # copy, as a callback may unsubscribe while we're dispatching
+            for subscriber in tuple(subscribers):
+                subscriber(event, data)
+
+    @callback
+    def _on_node_updated(self, event: EventType, node: MatterNode) -> None:
+        """Route a node update to the callbacks watching the node."""
+        if subscribers := self._node_subscribers.get(node.node_id):
+            for subscriber in tuple(subscribers):
+                subscriber(event, node)
+
+    @callback
+    def _on_node_event(self, event: EventType, node_event: MatterNodeEvent) -> None:
+        """Trace a node event and route it to the callbacks watching its endpoint."""
+        self.event_trace.record(node_event)
+        if subscribers := self._node_event_subscribers.get(
+            (node_event.node_id, node_event.endpoint_id)
+        ):
+            for subscriber in tuple(subscribers):
+                subscriber(event, node_event)
+
+    async def setup_nodes(self) -> None:
+        """Set up all existing nodes and subscribe to new nodes."""
+        self.config_entry.async_on_unload(self.interview_scheduler.async_cancel_all)
+        self.config_entry.async_on_unload(self._unsubscribe_client_events)
+        self._subscribe_client_events()
+        await self.discovery_snapshot.async_load(
+            self.hass, self.config_entry.entry_id
+        )
+
+        nodes = self.matter_client.get_nodes()
+        # only import the platforms the nodes may need
+        await async_load_platforms(
+            self.hass, set().union(*(get_node_platforms(node) for node in nodes))
+        )
+
+        # collect the entities of all nodes, so each platform
+        # gets all its entities in one batch during the initial setup
+        start = time.monotonic()
+        new_entities: dict[Platform, list[MatterEntity]] = {}
+        restored_endpoints: list[tuple[int, int]] = []
+        for node in nodes:
+            self._setup_node(
+                node,
+                new_entities=new_entities,
+                restored_endpoints=restored_endpoints,
             )
-            identifier = (DOMAIN, f"{ID_TYPE_DEVICE_ID}_{node_device_id}")
-            if device := device_registry.async_get_device(identifiers={identifier}):
-                device_registry.async_remove_device(device.id)
+        # set up the platforms with entities, which adds the pending entities
+        platforms = [
+            platform for platform, entities in new_entities.items() if entities
+        ]
+        for platform in platforms:
+            self._pending_entities.setdefault(platform, []).extend(
+                new_entities[platform]
+            )
+        self.forwarded_platforms.update(platforms)
+        await self.hass.config_entries.async_forward_entry_setups(
+            self.config_entry, platforms
+        )
+        LOGGER.debug(
+            "Initial setup of %s nodes took %.3f seconds "
+            "(%s endpoints restored from the discovery snapshot)",
+            len(nodes),
+            time.monotonic() - start,
+            len(restored_endpoints),
+        )
+        if restored_endpoints:
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self._async_validate_restored_endpoints(restored_endpoints),
+                "matter discovery snapshot validation",
+            )
+
+    async def _async_validate_restored_endpoints(
+        self, restored_endpoints: list[tuple[int, int]]
+    ) -> None:
+        """Run discovery for the endpoints set up from the discovery snapshot.
 
-        def node_removed_callback(event: EventType, node_id: int) -> None:
-            """Handle node removed event."""
+        Entities missing from the snapshot are added and entities which are
+        no longer discovered are removed. Runs in the background after startup,
+        yielding to the event loop between endpoints.
+        """
+        start = time.monotonic()
+        for node_id, endpoint_id in restored_endpoints:
+            await asyncio.sleep(0)
+            if endpoint_id not in self.discovered_entities.get(node_id, {}):
+                continue  # removed in the meantime
             try:
                 node = self.matter_client.get_node(node_id)
             except KeyError:
-                return  # race condition
-            for endpoint_id in node.endpoints:
-                endpoint_removed_callback(
-                    EventType.ENDPOINT_REMOVED,
-                    {"node_id": node_id, "endpoint_id": endpoint_id},
+                continue  # race condition
+            if (endpoint := node.endpoints.get(endpoint_id)) is None:
+                continue
+            fingerprint = get_endpoint_fingerprints(node)[endpoint_id]
+            new_entities: dict[Platform, list[MatterEntity]] = {}
+            try:
+                entity_infos = self._setup_endpoint(
+                    endpoint, new_entities, remove_stale=True
                 )
-
-        self.config_entry.async_on_unload(
-            self.matter_client.subscribe_events(
-                callback=endpoint_added_callback, event_filter=EventType.ENDPOINT_ADDED
-            )
-        )
-        self.config_entry.async_on_unload(
-            self.matter_client.subscribe_events(
-                callback=endpoint_removed_callback,
-                event_filter=EventType.ENDPOINT_REMOVED,
-            )
+            except Exception as err:  # noqa: BLE001
+                LOGGER.exception(
+                    "Error validating node %s endpoint %s: %s",
+                    node_id,
+                    endpoint_id,
+                    err,
+                )
+                continue
+            self._add_entities(new_entities)
+            self.discovery_snapshot.update(endpoint, fingerprint, entity_infos)
+        LOGGER.debug(
+            "Validated %s endpoints restored from the discovery snapshot in %.3f s",
+            len(restored_endpoints),
+            time.monotonic() - start,
         )
-        self.config_entry.async_on_unload(
-            self.matter_client.subscribe_events(
-                callback=node_removed_callback, event_filter=EventType.NODE_REMOVED
-            )
+
+    @callback
+    def async_mark_unavailable(self) -> None:
+        """Mark all entities unavailable, while disconnected from the server.
+
+        The availability is restored from the nodes on the next state refresh
+        (see async_rebind_client).
+        """
+        for endpoints in self.discovered_entities.values():
+            for entities in endpoints.values():
+                for entity in entities.values():
+                    if entity.hass is not None:
+                        entity.async_mark_unavailable()
+
+    @callback
+    def async_rebind_client(self, matter_client: MatterClient) -> None:
+        """Switch to a reconnected client, keeping the existing entities.
+
+        Used on a warm reconnect to the Matter server: the existing entities
+        are bound to the nodes of the new client, entities are only added
+        or removed for the endpoints of which the fingerprint changed
+        and nodes/endpoints which no longer exist are removed.
+        """
+        start = time.monotonic()
+        previous_client = self.matter_client
+        self._unsubscribe_client_events()
+        self.matter_client = matter_client
+        self.interview_scheduler.matter_client = matter_client
+        self._subscribe_client_events()
+
+        nodes = {node.node_id: node for node in matter_client.get_nodes()}
+        for node_id in tuple(self.discovered_entities):
+            if node_id in nodes:
+                continue
+            # the node was removed while we were disconnected
+            try:
+                self._remove_node(previous_client.get_node(node_id))
+            except KeyError:
+                self._forget_node(node_id)
+
+        new_entities: dict[Platform, list[MatterEntity]] = {}
+        for node in nodes.values():
+            self.device_info_cache.invalidate_node(node.node_id)
+            for endpoint_id, entities in tuple(
+                self.discovered_entities.get(node.node_id, {}).items()
+            ):
+                if (endpoint := node.endpoints.get(endpoint_id)) is None:
+                    # the endpoint was removed while we were disconnected
+                    self._remove_endpoint(
+                        previous_client.get_node(node.node_id), endpoint_id
+                    )
+                    continue
+                for entity in entities.values():
+                    entity.rebind(matter_client, endpoint)
+            if node.available:
+                self._setup_node(
+                    node,
+                    only_changed=True,
+                    new_entities=new_entities,
+                    remove_stale=True,
+                )
+        self._add_entities(new_entities)
+        # refresh the state of all (existing) entities
+        for node in nodes.values():
+            self._on_node_updated(EventType.NODE_UPDATED, node)
+        LOGGER.debug(
+            "Re-synced %s nodes after reconnect in %.3f seconds",
+            len(nodes),
+            time.monotonic() - start,
         )
-        self.config_entry.async_on_unload(
+
+    @callback
+    def _subscribe_client_events(self) -> None:
+        """Subscribe to the events of the (current) client."""
+        self._client_unsubscribes = [
             self.matter_client.subscribe_events(
-                callback=node_added_callback, event_filter=EventType.NODE_ADDED
+                callback=event_callback, event_filter=event_type
             )
-        )
-        self.config_entry.async_on_unload(
-            self.matter_client.subscribe_events(
-                callback=node_updated_callback, event_filter=EventType.NODE_UPDATED
+            for event_type, event_callback in (
+                # the entity event routers
+                (EventType.ATTRIBUTE_UPDATED, self._on_attribute_updated),
+                (EventType.NODE_UPDATED, self._on_node_updated),
+                (EventType.NODE_EVENT, self._on_node_event),
+                # node and endpoint lifecycle
+                (EventType.ENDPOINT_ADDED, self._on_endpoint_added),
+                (EventType.ENDPOINT_REMOVED, self._on_endpoint_removed),
+                (EventType.NODE_REMOVED, self._on_node_removed),
+                (EventType.NODE_ADDED, self._on_node_added),
+                (EventType.NODE_UPDATED, self._on_node_structure_updated),
             )
-        )
+        ]
+
+    @callback
+    def _unsubscribe_client_events(self) -> None:
+        """Unsubscribe from the events of the (current) client."""
+        for unsubscribe in self._client_unsubscribes:
+            unsubscribe()
+        self._client_unsubscribes = []
+
+    @callback
+    def _on_node_added(self, event: EventType, node: MatterNode) -> None:
+        """Handle node added event."""
+        # the node may have been re-commissioned
+        self.device_info_cache.invalidate_node(node.node_id)
+        self._setup_node(node)
+
+    @callback
+    def _on_node_structure_updated(self, event: EventType, node: MatterNode) -> None:
+        """Handle node updated event."""
+        self.device_info_cache.invalidate_node(node.node_id)
+        if not node.available:
+            return
+        # The firmware version could have been changed, features added or
+        # attribute values matched by the discovery schemas changed, so we run
+        # the discovery logic again for each endpoint of which the fingerprint
+        # changed since the last discovery run.
+        self._setup_node(node, only_changed=True)
+
+    @callback
+    def _on_endpoint_added(self, event: EventType, data: dict[str, int]) -> None:
+        """Handle endpoint added event."""
+        node = self.matter_client.get_node(data["node_id"])
+        if get_missing_platforms(node):
+            # sets up the new endpoint once the platforms are loaded
+            self._setup_node(node, only_changed=True)
+            return
+        new_entities: dict[Platform, list[MatterEntity]] = {}
+        self._setup_endpoint(node.endpoints[data["endpoint_id"]], new_entities)
+        self._add_entities(new_entities)
+
+    @callback
+    def _on_endpoint_removed(self, event: EventType, data: dict[str, int]) -> None:
+        """Handle endpoint removed event."""
+        try:
+            node = self.matter_client.get_node(data["node_id"])
+        except KeyError:
+            return  # race condition
+        self._remove_endpoint(node, data["endpoint_id"])
+
+    @callback
+    def _on_node_removed(self, event: EventType, node_id: int) -> None:
+        """Handle node removed event."""
+        self.device_info_cache.invalidate_node(node_id)
+        try:
+            node = self.matter_client.get_node(node_id)
+        except KeyError:
+            self._forget_node(node_id)
+            return  # race condition
+        self._remove_node(node)
+
+    @callback
+    def _remove_endpoint(self, node: MatterNode, endpoint_id: int) -> None:
+        """Remove the HA device of an endpoint."""
+        server_info = cast(ServerInfoMessage, self.matter_client.server_info)
+        device_registry = dr.async_get(self.hass)
+        endpoint = node.endpoints.get(endpoint_id)
+        if not endpoint:
+            return  # race condition
+        node_device_id = get_device_id(server_info, endpoint)
+        identifier = (DOMAIN, f"{ID_TYPE_DEVICE_ID}_{node_device_id}")
+        self._forget_endpoint(node.node_id, endpoint.endpoint_id)
+        if device := device_registry.async_get_device(identifiers={identifier}):
+            device_registry.async_remove_device(device.id)
+
+    @callback
+    def _remove_node(self, node: MatterNode) -> None:
+        """Remove the HA devices of all endpoints of a node."""
+        for endpoint_id in node.endpoints:
+            self._remove_endpoint(node, endpoint_id)
+        self._forget_node(node.node_id)
+
+    def _setup_node(
+        self,
+        node: MatterNode,
+        only_changed: bool = False,
+        new_entities: dict[Platform, list[MatterEntity]] | None = None,
+        remove_stale: bool = False,
+        restored_endpoints: list[tuple[int, int]] | None = None,
+    ) -> None:
+        """Set up an node.
 
-    def _setup_node(self, node: MatterNode) -> None:
-        """Set up an node."""
+        If only_changed is set, discovery only runs for the endpoints
+        of which the fingerprint changed since the last discovery run.
+        If new_entities is given, the discovered entities are collected into it
+        and the caller is responsible for adding them to the platforms.
+        If remove_stale is set, existing entities which are no longer
+        discovered are removed.
+        If restored_endpoints is given, the discovery snapshot is used for
+        the endpoints of which the fingerprint matches the snapshot and their
+        (node_id, endpoint_id) is collected into it, for later validation.
+        If the node may need platforms which are not loaded yet, the node
+        is set up in the background once they are (adding its own entities).
+        """
+        if missing_platforms := get_missing_platforms(node):
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self._async_load_platforms_and_setup_node(
+                    node, missing_platforms, only_changed, remove_stale
+                ),
+                f"matter setup node {node.node_id}",
+            )
+            return
         LOGGER.debug("Setting up entities for node %s", node.node_id)
+        start = time.monotonic()
+        node_entities: dict[Platform, list[MatterEntity]] = (
+            {} if new_entities is None else new_entities
+        )
         try:
+            fingerprints = get_endpoint_fingerprints(node)
+            node_fingerprints = self._endpoint_fingerprints.setdefault(node.node_id, {})
             for endpoint in node.endpoints.values():
+                fingerprint = fingerprints[endpoint.endpoint_id]
+                if (
+                    only_changed
+                    and node_fingerprints.get(endpoint.endpoint_id) == fingerprint
+                ):
+                    # discovery inputs unchanged, only the device info may change
+                    self._create_device_registry(endpoint)
+                    continue
+                snapshot_entity_infos = None
+                if restored_endpoints is not None:
+                    snapshot_entity_infos = self.discovery_snapshot.get(
+                        endpoint, fingerprint
+                    )
                 # Node endpoints are translated into HA devices
-                self._setup_endpoint(endpoint)
+                entity_infos = self._setup_endpoint(
+                    endpoint, node_entities, remove_stale, snapshot_entity_infos
+                )
+                node_fingerprints[endpoint.endpoint_id] = fingerprint
+                if snapshot_entity_infos is None:
+                    self.discovery_snapshot.update(endpoint, fingerprint, entity_infos)
+                elif restored_endpoints is not None:
+                    restored_endpoints.append((node.node_id, endpoint.endpoint_id))
         except Exception as err:  # noqa: BLE001
             # We don't want to crash the whole setup when a single node fails to setup
             # for whatever reason, so we catch all exceptions here.
@@ -148,6 +587,105 @@ class MatterAdapter:
                 node.node_id,
                 err,
             )
+        if new_entities is None:
+            self._add_entities(node_entities)
+        LOGGER.debug(
+            "Setting up node %s took %.3f seconds",
+            node.node_id,
+            time.monotonic() - start,
+        )
+
+    async def _async_load_platforms_and_setup_node(
+        self,
+        node: MatterNode,
+        platforms: set[Platform],
+        only_changed: bool,
+        remove_stale: bool,
+    ) -> None:
+        """Load the platforms the node needs, then set up the node."""
+        await async_load_platforms(self.hass, platforms)
+        self._setup_node(node, only_changed=only_changed, remove_stale=remove_stale)
+
+    def _index_device_id(self, device_id: str, endpoint: MatterEndpoint) -> None:
+        """Add the HA device id of an endpoint to the reverse index."""
+        location = (endpoint.node.node_id, endpoint.endpoint_id)
+        # the endpoints of a composed device share the device id of the
+        # compose parent, keep pointing at the first endpoint indexed for it
+        self._device_id_index.setdefault(device_id, location)
+        self._endpoint_device_ids.setdefault(location[0], {})[location[1]] = device_id
+
+    def _unindex_device_id(self, node_id: int, endpoint_id: int) -> None:
+        """Remove the HA device id of an endpoint from the reverse index.
+
+        If sibling endpoints of a composed device still share the device id,
+        the index entry is moved to one of them.
+        """
+        if (device_ids := self._endpoint_device_ids.get(node_id)) is None:
+            return
+        if (device_id := device_ids.pop(endpoint_id, None)) is None:
+            return
+        if self._device_id_index.get(device_id) != (node_id, endpoint_id):
+            return
+        for sibling_endpoint_id, sibling_device_id in device_ids.items():
+            if sibling_device_id == device_id:
+                self._device_id_index[device_id] = (node_id, sibling_endpoint_id)
+                return
+        del self._device_id_index[device_id]
+
+    def _forget_endpoint(self, node_id: int, endpoint_id: int) -> None:
+        """Drop all state kept for an endpoint."""
+        self._unindex_device_id(node_id, endpoint_id)
+        self.discovery_snapshot.forget_endpoint(node_id, endpoint_id)
+        for node_index in (
+            self.discovered_entities,
+            self._endpoint_fingerprints,
+            self._device_registry_data,
+            self._endpoint_device_ids,
+        ):
+            if (endpoint_index := node_index.get(node_id)) is None:
+                continue
+            endpoint_index.pop(endpoint_id, None)
+            if not endpoint_index:
+                del node_index[node_id]
+
+    def _forget_node(self, node_id: int) -> None:
+        """Drop all state kept for a node."""
+        for endpoint_id in tuple(self._endpoint_device_ids.get(node_id, ())):
+            self._unindex_device_id(node_id, endpoint_id)
+        self._endpoint_device_ids.pop(node_id, None)
+        self.discovered_entities.pop(node_id, None)
+        self._endpoint_fingerprints.pop(node_id, None)
+        self._device_registry_data.pop(node_id, None)
+        self.event_trace.forget_node(node_id)
+        self.discovery_snapshot.forget_node(node_id)
+
+    def _add_entities(
+        self, new_entities: dict[Platform, list[MatterEntity]]
+    ) -> None:
+        """Add the new entities to their platforms, in one batch per platform.
+
+        Platforms which are not set up yet are set up now,
+        their entities are added once the platform registered its handler.
+        """
+        late_platforms: list[Platform] = []
+        for platform, entities in new_entities.items():
+            if not entities:
+                continue
+            if (add_entities := self.platform_handlers.get(platform)) is not None:
+                add_entities(entities)
+                continue
+            self._pending_entities.setdefault(platform, []).extend(entities)
+            if platform not in self.forwarded_platforms:
+                self.forwarded_platforms.add(platform)
+                late_platforms.append(platform)
+        if late_platforms:
+            self.config_entry.async_create_task(
+                self.hass,
+                self.hass.config_entries.async_late_forward_entry_setups(
+                    self.config_entry, late_platforms
+                ),
+                "matter late platform setup",
+            )
 
     def _create_device_registry(
         self,
@@ -186,6 +724,7 @@ class MatterAdapter:
             server_info,
             endpoint,
         )
+        self._index_device_id(node_device_id, endpoint)
         identifiers = {(DOMAIN, f"{ID_TYPE_DEVICE_ID}_{node_device_id}")}
         serial_number: str | None = None
         # if available, we also add the serialnumber as identifier
@@ -215,40 +754,90 @@ class MatterAdapter:
         else:
             model_id = str(product_id) if (product_id := basic_info.productID) else None
 
-        dr.async_get(self.hass).async_get_or_create(
-            name=name,
-            config_entry_id=self.config_entry.entry_id,
-            identifiers=identifiers,
-            hw_version=basic_info.hardwareVersionString,
-            sw_version=basic_info.softwareVersionString,
-            manufacturer=basic_info.vendorName or endpoint.node.device_info.vendorName,
-            model=model_name,
-            model_id=model_id,
-            serial_number=serial_number,
-            via_device=(DOMAIN, bridge_device_id) if bridge_device_id else None,
+        device_data: dict[str, Any] = {
+            "name": name,
+            "config_entry_id": self.config_entry.entry_id,
+            "identifiers": identifiers,
+            "hw_version": basic_info.hardwareVersionString,
+            "sw_version": basic_info.softwareVersionString,
+            "manufacturer": (
+                basic_info.vendorName or endpoint.node.device_info.vendorName
+            ),
+            "model": model_name,
+            "model_id": model_id,
+            "serial_number": serial_number,
+            "via_device": (DOMAIN, bridge_device_id) if bridge_device_id else None,
+        }
+        # skip the device registry if the (basic) device information is unchanged
+        node_device_data = self._device_registry_data.setdefault(
+            endpoint.node.node_id, {}
         )
+        if node_device_data.get(endpoint.endpoint_id) == device_data:
+            return
+        dr.async_get(self.hass).async_get_or_create(**device_data)
+        node_device_data[endpoint.endpoint_id] = device_data
 
-    def _setup_endpoint(self, endpoint: MatterEndpoint) -> None:
-        """Set up a MatterEndpoint as HA Device."""
+    def _setup_endpoint(
+        self,
+        endpoint: MatterEndpoint,
+        new_entities: dict[Platform, list[MatterEntity]],
+        remove_stale: bool = False,
+        entity_infos: list[MatterEntityInfo] | None = None,
+    ) -> list[MatterEntityInfo]:
+        """Set up a MatterEndpoint as HA Device.
+
+        The discovered entities are collected into new_entities per platform.
+        If entity_infos is given (e.g. from the discovery snapshot),
+        those are used instead of running discovery.
+        Returns the discovery results used for the endpoint.
+        """
         # pre-create device registry entry
         self._create_device_registry(endpoint)
-        # run platform discovery from device type instances
-        for entity_info in async_discover_entities(endpoint):
-            discovery_key = (
-                f"{entity_info.platform}_{endpoint.node.node_id}_{endpoint.endpoint_id}_"
-                f"{entity_info.primary_attribute.cluster_id}_"
-                f"{entity_info.primary_attribute.attribute_id}_"
-                f"{entity_info.entity_description.key}"
-            )
-            if discovery_key in self.discovered_entities:
+        discovered_entities = self.discovered_entities.setdefault(
+            endpoint.node.node_id, {}
+        ).setdefault(endpoint.endpoint_id, {})
+        discovery_keys: set[DiscoveryKey] = set()
+        if entity_infos is None:
+            # run platform discovery from device type instances
+            entity_infos = list(async_discover_entities(endpoint))
+        for entity_info in entity_infos:
+            discovery_key: DiscoveryKey = (
+                entity_info.platform,
+                entity_info.primary_attribute.cluster_id,
+                entity_info.primary_attribute.attribute_id,
+                entity_info.entity_description.key,
+            )
+            discovery_keys.add(discovery_key)
+            if discovery_key in discovered_entities:
                 continue
             LOGGER.debug(
                 "Creating %s entity for %s",
                 entity_info.platform,
                 entity_info.primary_attribute,
             )
-            self.discovered_entities.add(discovery_key)
             new_entity = entity_info.entity_class(
                 self.matter_client, endpoint, entity_info
             )
-            self.platform_handlers[entity_info.platform]([new_entity])
+            discovered_entities[discovery_key] = new_entity
+            new_entities.setdefault(entity_info.platform, []).append(new_entity)
+        if not remove_stale:
+            return entity_infos
+        for discovery_key in discovered_entities.keys() - discovery_keys:
+            stale_entity = discovered_entities.pop(discovery_key)
+            LOGGER.debug("Removing %s, no longer discovered", stale_entity.entity_id)
+            if stale_entity.hass is None:
+                # not added to its platform yet
+                for pending_entities in self._pending_entities.values():
+                    if stale_entity in pending_entities:
+                        pending_entities.remove(stale_entity)
+                continue
+            # Only the entity object is removed, the registry entry (with the
+            # user's customizations) is kept for when the entity is discovered
+            # again, e.g. once all attributes are reported after a reconnect.
+            # Registry entries are cleaned up when the device or node is removed.
+            self.config_entry.async_create_background_task(
+                self.hass,
+                stale_entity.async_remove(),
+                f"matter remove {stale_entity.entity_id}",
+            )
+        return entity_infos
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Coroutine
+import asyncio
+from collections.abc import Awaitable, Callable, Coroutine
 from functools import wraps
+import time
 from typing import Any, Concatenate
 
 from matter_server.client.models.node import MatterNode
@@ -16,11 +18,26 @@ from homeassistant.components.websocket_api import ActiveConnection
 from homeassistant.core import HomeAssistant, callback
 
 from .adapter import MatterAdapter
+from .diagnostics import get_server_diagnostics_without_nodes, iter_redacted_nodes
 from .helpers import MissingNode, get_matter, node_from_ha_device_id
+from .interview import InterviewPriority
 
 ID = "id"
 TYPE = "type"
 DEVICE_ID = "device_id"
+DEVICE_IDS = "device_ids"
+ALL_NODES = "all"
+
+DIAGNOSTICS_CHUNK_SIZE = 10
+BULK_CONCURRENCY = 5
+MAX_BULK_CONCURRENCY = 50
+
+BULK_NODES_SCHEMA = {
+    vol.Required(DEVICE_IDS): vol.Any(ALL_NODES, [str]),
+    vol.Optional("concurrency", default=BULK_CONCURRENCY): vol.All(
+        int, vol.Range(min=1, max=MAX_BULK_CONCURRENCY)
+    ),
+}
 
 
 ERROR_NODE_NOT_FOUND = "node_not_found"
@@ -38,6 +55,9 @@ def async_register_api(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, websocket_open_commissioning_window)
     websocket_api.async_register_command(hass, websocket_remove_matter_fabric)
     websocket_api.async_register_command(hass, websocket_interview_node)
+    websocket_api.async_register_command(hass, websocket_stream_diagnostics)
+    websocket_api.async_register_command(hass, websocket_ping_nodes)
+    websocket_api.async_register_command(hass, websocket_interview_nodes)
 
 
 def async_get_node(
@@ -328,5 +348,188 @@ async def websocket_interview_node(
     node: MatterNode,
 ) -> None:
     """Interview a node."""
-    await matter.matter_client.interview_node(node_id=node.node_id)
+    await matter.interview_scheduler.async_interview(
+        node.node_id, InterviewPriority.HIGH
+    )
+    connection.send_result(msg[ID])
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required(TYPE): "matter/stream_diagnostics",
+        vol.Optional("chunk_size", default=DIAGNOSTICS_CHUNK_SIZE): vol.All(
+            int, vol.Range(min=1)
+        ),
+    }
+)
+@websocket_api.async_response
+@async_handle_failed_command
+@async_get_matter_adapter
+async def websocket_stream_diagnostics(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg: dict[str, Any],
+    matter: MatterAdapter,
+) -> None:
+    """Stream the (redacted) server diagnostics in chunks of nodes."""
+    server_diagnostics = await matter.matter_client.get_diagnostics()
+    connection.send_result(msg[ID])
+    connection.send_message(
+        websocket_api.event_message(
+            msg[ID], {"server": get_server_diagnostics_without_nodes(server_diagnostics)}
+        )
+    )
+    chunk: list[dict[str, Any]] = []
+    for node_data in iter_redacted_nodes(server_diagnostics):
+        chunk.append(node_data)
+        if len(chunk) < msg["chunk_size"]:
+            continue
+        connection.send_message(websocket_api.event_message(msg[ID], {"nodes": chunk}))
+        chunk = []
+        # give the event loop some air between chunks
+        await asyncio.sleep(0)
+    connection.send_message(
+        websocket_api.event_message(msg[ID], {"nodes": chunk, "done": True})
+    )
+
+
+async def _async_bulk_node_operation(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg: dict[str, Any],
+    matter: MatterAdapter,
+    operation: Callable[[int], Awaitable[Any]],
+) -> None:
+    """Run an operation on many nodes concurrently and stream the results.
+
+    A result message is sent at the start, followed by an event per node
+    as soon as the operation on that node completes (in completion order)
+    and a final event once all nodes are done.
+    """
+    targets: list[tuple[str | None, int | None]] = []
+    if msg[DEVICE_IDS] == ALL_NODES:
+        targets.extend(
+            (None, node.node_id) for node in matter.matter_client.get_nodes()
+        )
+    else:
+        for device_id in msg[DEVICE_IDS]:
+            try:
+                node = node_from_ha_device_id(hass, device_id)
+            except MissingNode:
+                node = None
+            targets.append((device_id, node.node_id if node else None))
+
+    semaphore = asyncio.Semaphore(msg["concurrency"])
+
+    async def _async_run(device_id: str | None, node_id: int | None) -> dict[str, Any]:
+        """Run the operation on a single node and return its report."""
+        report: dict[str, Any] = {DEVICE_ID: device_id, "node_id": node_id}
+        if node_id is None:
+            return {
+                **report,
+                "success": False,
+                "error_code": ERROR_NODE_NOT_FOUND,
+                "error": f"Could not resolve Matter node from device id {device_id}",
+            }
+        async with semaphore:
+            start = time.monotonic()
+            try:
+                result = await operation(node_id)
+            except MatterError as err:
+                report.update(
+                    success=False, error_code=str(err.error_code), error=str(err)
+                )
+            except Exception as err:  # noqa: BLE001
+                # e.g. NotConnected or a timeout, reported as the node's failure
+                report.update(
+                    success=False,
+                    error_code=websocket_api.ERR_UNKNOWN_ERROR,
+                    error=str(err) or type(err).__name__,
+                )
+            else:
+                report.update(success=True, result=result)
+            report["duration"] = time.monotonic() - start
+        return report
+
+    start = time.monotonic()
+    tasks = [
+        hass.async_create_task(
+            _async_run(device_id, node_id), f"{msg[TYPE]} node {node_id}"
+        )
+        for device_id, node_id in targets
+    ]
+
+    @callback
+    def _async_cancel() -> None:
+        """Stop the operations when the client unsubscribes or disconnects."""
+        for task in tasks:
+            task.cancel()
+
+    connection.subscriptions[msg[ID]] = _async_cancel
     connection.send_result(msg[ID])
+    try:
+        for report in asyncio.as_completed(tasks):
+            connection.send_message(websocket_api.event_message(msg[ID], await report))
+        connection.send_message(
+            websocket_api.event_message(
+                msg[ID],
+                {
+                    "done": True,
+                    "nodes": len(targets),
+                    "duration": time.monotonic() - start,
+                },
+            )
+        )
+    finally:
+        # the result was already sent, so never leave the operations running
+        # or the subscription behind, even if reporting itself failed
+        _async_cancel()
+        connection.subscriptions.pop(msg[ID], None)
+
+
+@websocket_api.websocket_command(
+    {vol.Required(TYPE): "matter/ping_nodes", **BULK_NODES_SCHEMA}
+)
+@websocket_api.async_response
+@async_handle_failed_command
+@async_get_matter_adapter
+async def websocket_ping_nodes(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg: dict[str, Any],
+    matter: MatterAdapter,
+) -> None:
+    """Ping many nodes (or all nodes) concurrently."""
+    await _async_bulk_node_operation(
+        hass,
+        connection,
+        msg,
+        matter,
+        lambda node_id: matter.matter_client.ping_node(node_id=node_id),
+    )
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {vol.Required(TYPE): "matter/interview_nodes", **BULK_NODES_SCHEMA}
+)
+@websocket_api.async_response
+@async_handle_failed_command
+@async_get_matter_adapter
+async def websocket_interview_nodes(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg: dict[str, Any],
+    matter: MatterAdapter,
+) -> None:
+    """Interview many nodes (or all nodes) concurrently."""
+    await _async_bulk_node_operation(
+        hass,
+        connection,
+        msg,
+        matter,
+        lambda node_id: matter.interview_scheduler.async_interview(
+            node_id, InterviewPriority.LOW
+        ),
+    )
@@ -16,9 +16,14 @@ from homeassistant.components.hassio import (
     AddonState,
 )
 from homeassistant.components.onboarding import async_is_onboarded
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
 from homeassistant.const import CONF_URL
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import AbortFlow
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import aiohttp_client
@@ -29,6 +34,7 @@ from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
 from .addon import get_addon_manager
 from .const import (
     ADDON_SLUG,
+    CONF_COMMAND_PIPELINING,
     CONF_INTEGRATION_CREATED_ADDON,
     CONF_USE_ADDON,
     DOMAIN,
@@ -74,6 +80,12 @@ class MatterConfigFlow(ConfigFlow, domain=DOMAIN):
         self.start_task: asyncio.Task | None = None
         self.use_addon = False
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> MatterOptionsFlow:
+        """Return the options flow."""
+        return MatterOptionsFlow()
+
     async def async_step_install_addon(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -348,5 +360,30 @@ class MatterConfigFlow(ConfigFlow, domain=DOMAIN):
         )
 
 
+class MatterOptionsFlow(OptionsFlow):
+    """Handle the options of the Matter integration."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_COMMAND_PIPELINING,
+                        default=self.config_entry.options.get(
+                            CONF_COMMAND_PIPELINING, False
+                        ),
+                    ): bool,
+                }
+            ),
+        )
+
+
 class FailedConnect(HomeAssistantError):
     """Failed to connect to the Matter Server."""
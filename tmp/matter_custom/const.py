@@ -4,6 +4,7 @@ import logging
 
 ADDON_SLUG = "core_matter_server"
 
+CONF_COMMAND_PIPELINING = "command_pipelining"
 CONF_INTEGRATION_CREATED_ADDON = "integration_created_addon"
 CONF_USE_ADDON = "use_addon"
 
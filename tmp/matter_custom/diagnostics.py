@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
-from typing import Any
+from collections.abc import Generator
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any
 
 from chip.clusters import Objects
-from matter_server.common.helpers.util import dataclass_to_dict, parse_attribute_path
+from matter_server.common.helpers.util import dataclass_to_dict
 
 from homeassistant.components.diagnostics import REDACTED
 from homeassistant.config_entries import ConfigEntry
@@ -15,22 +16,56 @@ from homeassistant.helpers import device_registry as dr
 
 from .helpers import get_matter, get_node_from_device_entry
 
+if TYPE_CHECKING:
+    from matter_server.common.models import ServerDiagnostics
+
 ATTRIBUTES_TO_REDACT = {Objects.BasicInformation.Attributes.Location}
+# "cluster_id/attribute_id" part of the attribute paths to redact,
+# so redaction is a single set lookup per attribute
+ATTRIBUTE_PATHS_TO_REDACT = frozenset(
+    f"{attribute.cluster_id}/{attribute.attribute_id}"
+    for attribute in ATTRIBUTES_TO_REDACT
+)
 
 
 def redact_matter_attributes(node_data: dict[str, Any]) -> dict[str, Any]:
-    """Redact Matter cluster attribute."""
-    redacted = deepcopy(node_data)
-    for attribute_to_redact in ATTRIBUTES_TO_REDACT:
-        for attribute_path in redacted["attributes"]:
-            _, cluster_id, attribute_id = parse_attribute_path(attribute_path)
-            if cluster_id != attribute_to_redact.cluster_id:
-                continue
-            if attribute_id != attribute_to_redact.attribute_id:
-                continue
-            redacted["attributes"][attribute_path] = REDACTED
+    """Redact Matter cluster attribute.
+
+    Only the top level and the attributes dict are copied,
+    the (unredacted) attribute values are shared with the input.
+    """
+    if (attributes := node_data.get("attributes")) is None:
+        return node_data
+    return {
+        **node_data,
+        "attributes": {
+            attribute_path: (
+                REDACTED
+                if attribute_path.partition("/")[2] in ATTRIBUTE_PATHS_TO_REDACT
+                else value
+            )
+            for attribute_path, value in attributes.items()
+        },
+    }
+
 
-    return redacted
+def get_server_diagnostics_without_nodes(
+    server_diagnostics: ServerDiagnostics,
+) -> dict[str, Any]:
+    """Return the server diagnostics as dict, without the nodes."""
+    return dataclass_to_dict(replace(server_diagnostics, nodes=[]))
+
+
+def iter_redacted_nodes(
+    server_diagnostics: ServerDiagnostics,
+) -> Generator[dict[str, Any]]:
+    """Iterate over the redacted node data of the server diagnostics.
+
+    Nodes are converted and redacted one at a time,
+    so they can be written out incrementally.
+    """
+    for node in server_diagnostics.nodes:
+        yield redact_matter_attributes(dataclass_to_dict(node))
 
 
 def remove_serialization_type(data: dict[str, Any]) -> dict[str, Any]:
@@ -46,11 +81,15 @@ async def async_get_config_entry_diagnostics(
     """Return diagnostics for a config entry."""
     matter = get_matter(hass)
     server_diagnostics = await matter.matter_client.get_diagnostics()
-    data = dataclass_to_dict(server_diagnostics)
-    nodes = [redact_matter_attributes(node_data) for node_data in data["nodes"]]
-    data["nodes"] = nodes
+    data = get_server_diagnostics_without_nodes(server_diagnostics)
+    data["nodes"] = list(iter_redacted_nodes(server_diagnostics))
 
-    return {"server": data}
+    return {
+        "server": data,
+        "device_info_cache": matter.device_info_cache.as_dict(),
+        "event_trace": matter.event_trace.as_dict(),
+        "interview_scheduler": matter.interview_scheduler.as_dict(),
+    }
 
 
 async def async_get_device_diagnostics(
@@ -66,4 +105,5 @@ async def async_get_device_diagnostics(
         "node": redact_matter_attributes(
             remove_serialization_type(dataclass_to_dict(node.node_data) if node else {})
         ),
+        "event_trace": matter.event_trace.as_dict(node.node_id) if node else None,
     }
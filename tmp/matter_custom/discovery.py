@@ -2,59 +2,377 @@
 
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import Generator, Iterable
+import importlib
+from types import ModuleType
 
-from chip.clusters.ClusterObjects import ClusterAttributeDescriptor, NullValue
-from matter_server.client.models.node import MatterEndpoint
+from chip.clusters import Objects as clusters
+from chip.clusters.ClusterObjects import (
+    Cluster,
+    ClusterAttributeDescriptor,
+    NullValue,
+)
+from matter_server.client.models.node import MatterEndpoint, MatterNode
+from matter_server.common import custom_clusters
 
 from homeassistant.const import Platform
-from homeassistant.core import callback
-
-from .binary_sensor import DISCOVERY_SCHEMAS as BINARY_SENSOR_SCHEMAS
-from .button import DISCOVERY_SCHEMAS as BUTTON_SCHEMAS
-from .climate import DISCOVERY_SCHEMAS as CLIMATE_SENSOR_SCHEMAS
-from .const import FEATUREMAP_ATTRIBUTE_ID
-from .cover import DISCOVERY_SCHEMAS as COVER_SCHEMAS
-from .event import DISCOVERY_SCHEMAS as EVENT_SCHEMAS
-from .fan import DISCOVERY_SCHEMAS as FAN_SCHEMAS
-from .light import DISCOVERY_SCHEMAS as LIGHT_SCHEMAS
-from .lock import DISCOVERY_SCHEMAS as LOCK_SCHEMAS
-from .models import UNSET, MatterDiscoverySchema, MatterEntityInfo
-from .number import DISCOVERY_SCHEMAS as NUMBER_SCHEMAS
-from .select import DISCOVERY_SCHEMAS as SELECT_SCHEMAS
-from .sensor import DISCOVERY_SCHEMAS as SENSOR_SCHEMAS
-from .switch import DISCOVERY_SCHEMAS as SWITCH_SCHEMAS
-from .update import DISCOVERY_SCHEMAS as UPDATE_SCHEMAS
-from .vacuum import DISCOVERY_SCHEMAS as VACUUM_SCHEMAS
-from .valve import DISCOVERY_SCHEMAS as VALVE_SCHEMAS
-from .water_heater import DISCOVERY_SCHEMAS as WATER_HEATER_SCHEMAS
-
-DISCOVERY_SCHEMAS: dict[Platform, list[MatterDiscoverySchema]] = {
-    Platform.BINARY_SENSOR: BINARY_SENSOR_SCHEMAS,
-    Platform.BUTTON: BUTTON_SCHEMAS,
-    Platform.CLIMATE: CLIMATE_SENSOR_SCHEMAS,
-    Platform.COVER: COVER_SCHEMAS,
-    Platform.EVENT: EVENT_SCHEMAS,
-    Platform.FAN: FAN_SCHEMAS,
-    Platform.LIGHT: LIGHT_SCHEMAS,
-    Platform.LOCK: LOCK_SCHEMAS,
-    Platform.NUMBER: NUMBER_SCHEMAS,
-    Platform.SELECT: SELECT_SCHEMAS,
-    Platform.SENSOR: SENSOR_SCHEMAS,
-    Platform.SWITCH: SWITCH_SCHEMAS,
-    Platform.UPDATE: UPDATE_SCHEMAS,
-    Platform.VACUUM: VACUUM_SCHEMAS,
-    Platform.VALVE: VALVE_SCHEMAS,
-    Platform.WATER_HEATER: WATER_HEATER_SCHEMAS,
+from homeassistant.core import HomeAssistant, callback
+
+from .const import FEATUREMAP_ATTRIBUTE_ID, LOGGER
+from .models import (
+    UNSET,
+    MatterDiscoveryReads,
+    MatterDiscoverySchema,
+    MatterEntityInfo,
+)
+
+# clusters of the primary attributes of the discovery schemas of each platform,
+# so the platforms an endpoint may need are known without importing
+# the platform (entity) code. Must be kept in sync with the platform schemas,
+# which is enforced by test_matter_custom_discovery.py and the replay harness.
+PLATFORM_CLUSTERS: dict[Platform, tuple[type[Cluster], ...]] = {
+    Platform.BINARY_SENSOR: (
+        clusters.BooleanState,
+        clusters.DishwasherAlarm,
+        clusters.DoorLock,
+        clusters.EnergyEvse,
+        clusters.OccupancySensing,
+        clusters.PowerSource,
+        clusters.PumpConfigurationAndControl,
+        clusters.RefrigeratorAlarm,
+        clusters.SmokeCoAlarm,
+        clusters.Thermostat,
+        clusters.ValveConfigurationAndControl,
+        clusters.WaterHeaterManagement,
+        clusters.WindowCovering,
+    ),
+    Platform.BUTTON: (
+        clusters.ActivatedCarbonFilterMonitoring,
+        clusters.HepaFilterMonitoring,
+        clusters.Identify,
+        clusters.OperationalState,
+        clusters.SmokeCoAlarm,
+        clusters.WaterHeaterManagement,
+    ),
+    Platform.CLIMATE: (clusters.Thermostat,),
+    Platform.COVER: (clusters.WindowCovering,),
+    Platform.EVENT: (clusters.Switch,),
+    Platform.FAN: (clusters.FanControl,),
+    Platform.LIGHT: (clusters.OnOff,),
+    Platform.LOCK: (clusters.DoorLock,),
+    Platform.NUMBER: (
+        clusters.DoorLock,
+        clusters.LevelControl,
+        clusters.MicrowaveOvenControl,
+        clusters.OccupancySensing,
+        clusters.TemperatureControl,
+        clusters.Thermostat,
+        clusters.ValveConfigurationAndControl,
+        custom_clusters.EveCluster,
+        custom_clusters.InovelliCluster,
+    ),
+    Platform.SELECT: (
+        clusters.BooleanStateConfiguration,
+        clusters.DeviceEnergyManagementMode,
+        clusters.DishwasherMode,
+        clusters.DoorLock,
+        clusters.EnergyEvseMode,
+        clusters.LaundryWasherControls,
+        clusters.LaundryWasherMode,
+        clusters.MicrowaveOvenControl,
+        clusters.ModeSelect,
+        clusters.OnOff,
+        clusters.OvenMode,
+        clusters.PumpConfigurationAndControl,
+        clusters.RefrigeratorAndTemperatureControlledCabinetMode,
+        clusters.RvcCleanMode,
+        clusters.SmokeCoAlarm,
+        clusters.TemperatureControl,
+        clusters.ThermostatUserInterfaceConfiguration,
+    ),
+    Platform.SENSOR: (
+        clusters.ActivatedCarbonFilterMonitoring,
+        clusters.AirQuality,
+        clusters.CarbonDioxideConcentrationMeasurement,
+        clusters.CarbonMonoxideConcentrationMeasurement,
+        clusters.DeviceEnergyManagement,
+        clusters.DoorLock,
+        clusters.ElectricalEnergyMeasurement,
+        clusters.ElectricalPowerMeasurement,
+        clusters.EnergyEvse,
+        clusters.FlowMeasurement,
+        clusters.HepaFilterMonitoring,
+        clusters.IlluminanceMeasurement,
+        clusters.NitrogenDioxideConcentrationMeasurement,
+        clusters.OperationalState,
+        clusters.OvenCavityOperationalState,
+        clusters.OzoneConcentrationMeasurement,
+        clusters.Pm1ConcentrationMeasurement,
+        clusters.Pm10ConcentrationMeasurement,
+        clusters.Pm25ConcentrationMeasurement,
+        clusters.PowerSource,
+        clusters.PressureMeasurement,
+        clusters.PumpConfigurationAndControl,
+        clusters.RelativeHumidityMeasurement,
+        clusters.RvcOperationalState,
+        clusters.ServiceArea,
+        clusters.SmokeCoAlarm,
+        clusters.Switch,
+        clusters.TemperatureMeasurement,
+        clusters.Thermostat,
+        clusters.TotalVolatileOrganicCompoundsConcentrationMeasurement,
+        clusters.ValveConfigurationAndControl,
+        clusters.WaterHeaterManagement,
+        clusters.WindowCovering,
+        custom_clusters.DraftElectricalMeasurementCluster,
+        custom_clusters.EveCluster,
+        custom_clusters.NeoCluster,
+        custom_clusters.ThirdRealityMeteringCluster,
+    ),
+    Platform.SWITCH: (
+        clusters.DoorLock,
+        clusters.EnergyEvse,
+        clusters.OnOff,
+        clusters.ThermostatUserInterfaceConfiguration,
+    ),
+    Platform.UPDATE: (clusters.OtaSoftwareUpdateRequestor,),
+    Platform.VACUUM: (clusters.RvcRunMode,),
+    Platform.VALVE: (clusters.ValveConfigurationAndControl,),
+    Platform.WATER_HEATER: (clusters.Thermostat,),
 }
-SUPPORTED_PLATFORMS = tuple(DISCOVERY_SCHEMAS)
+SUPPORTED_PLATFORMS = tuple(PLATFORM_CLUSTERS)
+
+
+def _build_cluster_platforms() -> dict[int, tuple[Platform, ...]]:
+    """Build the cluster_id -> platforms map from PLATFORM_CLUSTERS."""
+    cluster_platforms: dict[int, list[Platform]] = {}
+    for platform, platform_clusters in PLATFORM_CLUSTERS.items():
+        for cluster in platform_clusters:
+            cluster_platforms.setdefault(cluster.id, []).append(platform)
+    return {
+        cluster_id: tuple(platforms)
+        for cluster_id, platforms in cluster_platforms.items()
+    }
+
+
+# cluster_id -> platforms which may discover an entity for the cluster
+CLUSTER_PLATFORMS = _build_cluster_platforms()
+
+# discovery schemas of the platforms loaded so far,
+# the platform modules are imported on demand (see async_load_platforms)
+DISCOVERY_SCHEMAS: dict[Platform, list[MatterDiscoverySchema]] = {}
 
 
 @callback
 def iter_schemas() -> Generator[MatterDiscoverySchema]:
-    """Iterate over all available discovery schemas."""
-    for platform_schemas in DISCOVERY_SCHEMAS.values():
-        yield from platform_schemas
+    """Iterate over the discovery schemas of the loaded platforms.
+
+    The schemas are always returned in the order of SUPPORTED_PLATFORMS,
+    independent of the order in which the platforms were loaded.
+    """
+    for platform in SUPPORTED_PLATFORMS:
+        yield from DISCOVERY_SCHEMAS.get(platform, ())
+
+
+@callback
+def get_node_platforms(node: MatterNode) -> set[Platform]:
+    """Return the platforms which may discover entities for the node."""
+    return {
+        platform
+        for endpoint in node.endpoints.values()
+        for cluster_id in endpoint.clusters
+        for platform in CLUSTER_PLATFORMS.get(cluster_id, ())
+    }
+
+
+@callback
+def get_missing_platforms(node: MatterNode) -> set[Platform]:
+    """Return the platforms the node may need which are not loaded yet."""
+    return get_node_platforms(node).difference(DISCOVERY_SCHEMAS)
+
+
+def _import_platforms(platforms: Iterable[Platform]) -> dict[Platform, ModuleType]:
+    """Import the platform modules (blocking)."""
+    return {
+        platform: importlib.import_module(f".{platform}", __package__)
+        for platform in platforms
+    }
+
+
+def _get_unlisted_schemas(platform: Platform) -> list[str]:
+    """Return the (loaded) schemas of which the primary cluster is not listed.
+
+    Such a schema is not matched if its cluster is the only one of an endpoint
+    listed for the platform, as the platform would not be loaded.
+    """
+    platform_cluster_ids = {cluster.id for cluster in PLATFORM_CLUSTERS[platform]}
+    return [
+        schema.entity_description.key
+        for schema in DISCOVERY_SCHEMAS[platform]
+        if schema.required_attributes[0].cluster_id not in platform_cluster_ids
+    ]
+
+
+def check_platform_clusters() -> None:
+    """Raise if PLATFORM_CLUSTERS is out of sync with the loaded platform schemas."""
+    if unlisted := {
+        platform: schema_keys
+        for platform in DISCOVERY_SCHEMAS
+        if (schema_keys := _get_unlisted_schemas(platform))
+    }:
+        raise ValueError(
+            f"Primary cluster of schemas missing in PLATFORM_CLUSTERS: {unlisted}"
+        )
+
+
+@callback
+def _register_platforms(modules: dict[Platform, ModuleType]) -> None:
+    """Register the discovery schemas of the imported platform modules."""
+    for platform, module in modules.items():
+        DISCOVERY_SCHEMAS[platform] = module.DISCOVERY_SCHEMAS
+        for schema_key in _get_unlisted_schemas(platform):
+            LOGGER.warning(
+                "Primary cluster of %s schema %s missing in PLATFORM_CLUSTERS",
+                platform,
+                schema_key,
+            )
+    # keep the same dict object, it is looked up on every discovery run
+    index = _build_discovery_index()
+    DISCOVERY_INDEX.clear()
+    DISCOVERY_INDEX.update(index)
+    reads = _build_discovery_reads()
+    DISCOVERY_READS.clear()
+    DISCOVERY_READS.update(reads)
+
+
+def load_platforms(platforms: Iterable[Platform] = SUPPORTED_PLATFORMS) -> None:
+    """Load the discovery schemas of the platforms, outside of the event loop."""
+    if missing := set(platforms).difference(DISCOVERY_SCHEMAS):
+        _register_platforms(_import_platforms(missing))
+
+
+async def async_load_platforms(
+    hass: HomeAssistant, platforms: Iterable[Platform]
+) -> None:
+    """Load the discovery schemas of the platforms.
+
+    The platform modules are imported in the executor.
+    """
+    if not (missing := set(platforms).difference(DISCOVERY_SCHEMAS)):
+        return
+    modules = await hass.async_add_import_executor_job(_import_platforms, missing)
+    _register_platforms(modules)
+
+
+type IndexedSchemas = tuple[tuple[int, MatterDiscoverySchema], ...]
+type DiscoveryIndex = dict[
+    int, dict[type[ClusterAttributeDescriptor], IndexedSchemas]
+]
+
+
+def _build_discovery_index() -> DiscoveryIndex:
+    """Build the discovery index from all discovery schemas.
+
+    The index maps cluster_id -> primary attribute -> (position, schema)
+    so an endpoint only needs to evaluate the schemas for which
+    it actually exposes the primary attribute.
+    The position is used to preserve the original schema (priority) order.
+    """
+    index: dict[int, dict[type[ClusterAttributeDescriptor], list]] = {}
+    for position, schema in enumerate(iter_schemas()):
+        primary_attribute = schema.required_attributes[0]
+        index.setdefault(primary_attribute.cluster_id, {}).setdefault(
+            primary_attribute, []
+        ).append((position, schema))
+    return {
+        cluster_id: {
+            attribute: tuple(schemas) for attribute, schemas in attributes.items()
+        }
+        for cluster_id, attributes in index.items()
+    }
+
+
+# rebuilt when platforms are loaded so discovery does not need to walk all schemas
+DISCOVERY_INDEX: DiscoveryIndex = {}
+
+
+def _attribute_key(attribute: type[ClusterAttributeDescriptor]) -> tuple[int, int]:
+    """Return the (cluster_id, attribute_id) of an attribute."""
+    return (attribute.cluster_id, attribute.attribute_id)
+
+
+def _build_discovery_reads() -> dict[int, MatterDiscoveryReads]:
+    """Build the map of what discovery reads of an endpoint, per primary cluster.
+
+    Covers the presence of the required, optional and absent attributes,
+    the null-ness of the required attributes, the values matched by the
+    value filters (the primary and secondary attribute for value_contains and
+    value_is_not, the FeatureMap of the primary cluster for featuremap_contains)
+    and the presence of the absent clusters on the node.
+    The device types and vendor/product info are read for every endpoint.
+    """
+    present: dict[int, set[tuple[int, int]]] = {}
+    non_null: dict[int, set[tuple[int, int]]] = {}
+    values: dict[int, set[tuple[int, int]]] = {}
+    node_clusters: dict[int, set[int]] = {}
+    for schema in iter_schemas():
+        primary_attribute = schema.required_attributes[0]
+        cluster_id = primary_attribute.cluster_id
+        cluster_present = present.setdefault(cluster_id, set())
+        cluster_present.update(map(_attribute_key, schema.required_attributes))
+        cluster_present.update(map(_attribute_key, schema.optional_attributes or ()))
+        cluster_present.update(map(_attribute_key, schema.absent_attributes or ()))
+        cluster_non_null = non_null.setdefault(cluster_id, set())
+        if not schema.allow_none_value:
+            cluster_non_null.update(map(_attribute_key, schema.required_attributes))
+        cluster_values = values.setdefault(cluster_id, set())
+        if schema.featuremap_contains is not None:
+            cluster_values.add((cluster_id, FEATUREMAP_ATTRIBUTE_ID))
+        if schema.value_contains is not UNSET or schema.value_is_not is not UNSET:
+            cluster_values.add(_attribute_key(primary_attribute))
+        if len(schema.required_attributes) > 1 and (
+            schema.secondary_value_contains is not UNSET
+            or schema.secondary_value_is_not is not UNSET
+        ):
+            cluster_values.add(_attribute_key(schema.required_attributes[1]))
+        node_clusters.setdefault(cluster_id, set()).update(
+            cluster.id for cluster in schema.absent_clusters or ()
+        )
+    return {
+        cluster_id: MatterDiscoveryReads(
+            present=tuple(sorted(present[cluster_id])),
+            non_null=tuple(sorted(non_null[cluster_id])),
+            values=tuple(sorted(values[cluster_id])),
+            node_clusters=tuple(sorted(node_clusters[cluster_id])),
+        )
+        for cluster_id in present
+    }
+
+
+# primary cluster_id -> what the discovery schemas read of an endpoint,
+# rebuilt when platforms are loaded (see get_endpoint_fingerprints)
+DISCOVERY_READS: dict[int, MatterDiscoveryReads] = {}
+
+
+@callback
+def iter_endpoint_schemas(
+    endpoint: MatterEndpoint,
+) -> Generator[MatterDiscoverySchema]:
+    """Iterate over the discovery schemas which may apply to the given endpoint.
+
+    Only schemas for which the endpoint has the primary attribute are returned,
+    in the same order as they are returned by iter_schemas.
+    """
+    candidates: list[tuple[int, MatterDiscoverySchema]] = []
+    for cluster_id in endpoint.clusters:
+        if (cluster_schemas := DISCOVERY_INDEX.get(cluster_id)) is None:
+            continue
+        for primary_attribute, schemas in cluster_schemas.items():
+            if endpoint.has_attribute(None, primary_attribute):
+                candidates.extend(schemas)
+    candidates.sort(key=lambda candidate: candidate[0])
+    for _, schema in candidates:
+        yield schema
 
 
 @callback
@@ -64,7 +382,7 @@ def async_discover_entities(
     """Run discovery on MatterEndpoint and return matching MatterEntityInfo(s)."""
     discovered_attributes: set[type[ClusterAttributeDescriptor]] = set()
     device_info = endpoint.device_info
-    for schema in iter_schemas():
+    for schema in iter_endpoint_schemas(endpoint):
         # abort if attribute(s) already discovered
         if any(x in schema.required_attributes for x in discovered_attributes):
             continue
@@ -112,9 +430,10 @@ def async_discover_entities(
             continue
 
         # check required attributes
-        if schema.required_attributes is not None and not all(
+        # (the primary attribute is already guaranteed by the discovery index)
+        if not all(
             endpoint.has_attribute(None, val_schema)
-            for val_schema in schema.required_attributes
+            for val_schema in schema.required_attributes[1:]
         ):
             continue
 
@@ -214,7 +533,7 @@ def async_discover_entities(
         yield MatterEntityInfo(
             endpoint=endpoint,
             platform=schema.platform,
-            attributes_to_watch=attributes_to_watch,
+            attributes_to_watch=tuple(attributes_to_watch),
             entity_description=schema.entity_description,
             entity_class=schema.entity_class,
             discovery_schema=schema,
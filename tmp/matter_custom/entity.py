@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable, Coroutine
-from dataclasses import dataclass
+from contextlib import suppress
+from dataclasses import dataclass, replace
 import functools
 import logging
+import sys
 from typing import TYPE_CHECKING, Any, Concatenate, cast
 
 from chip.clusters import Objects as clusters
@@ -26,7 +29,7 @@ from homeassistant.helpers.entity import Entity, EntityDescription
 from homeassistant.helpers.typing import UndefinedType
 
 from .const import DOMAIN, FEATUREMAP_ATTRIBUTE_ID, ID_TYPE_DEVICE_ID
-from .helpers import get_device_id
+from .helpers import get_device_id, get_matter
 
 if TYPE_CHECKING:
     from matter_server.client import MatterClient
@@ -86,6 +89,12 @@ class MatterEntity(Entity):
     _attr_should_poll = False
     _name_postfix: str | None = None
     _platform_translation_key: str | None = None
+    # Opt-in coalescing of state writes for bursty attribute reports.
+    # None writes the state for every attribute update, 0 coalesces all updates
+    # arriving within the same event loop iteration and any positive value
+    # coalesces all updates arriving within that many seconds.
+    _state_write_coalesce_delay: float | None = None
+    _pending_state_write: asyncio.Handle | None = None
 
     def __init__(
         self,
@@ -99,8 +108,6 @@ class MatterEntity(Entity):
         self._entity_info = entity_info
         self.entity_description = entity_info.entity_description
         self._unsubscribes: list[Callable] = []
-        # for fast lookups we create a mapping to the attribute paths
-        self._attributes_map: dict[type, str] = {}
         # The server info is set when the client connects to the server.
         server_info = cast(ServerInfoMessage, self.matter_client.server_info)
         # create unique_id based on "Operational Instance Name" and endpoint/device type
@@ -177,38 +184,31 @@ class MatterEntity(Entity):
         """Handle being added to Home Assistant."""
         await super().async_added_to_hass()
 
-        # Subscribe to attribute updates.
+        # Subscribe to attribute updates through the adapter's event router.
+        matter = get_matter(self.hass)
+        node_id = self._endpoint.node.node_id
         sub_paths: list[str] = []
         for attr_cls in self._entity_info.attributes_to_watch:
             attr_path = self.get_matter_attribute_path(attr_cls)
             if attr_path in sub_paths:
                 # prevent duplicate subscriptions
                 continue
-            self._attributes_map[attr_cls] = attr_path
             sub_paths.append(attr_path)
             self._unsubscribes.append(
-                self.matter_client.subscribe_events(
-                    callback=self._on_matter_event,
-                    event_filter=EventType.ATTRIBUTE_UPDATED,
-                    node_filter=self._endpoint.node.node_id,
-                    attr_path_filter=attr_path,
+                matter.subscribe_attribute_events(
+                    self._on_matter_event, node_id, attr_path
                 )
             )
         # subscribe to node (availability changes)
         self._unsubscribes.append(
-            self.matter_client.subscribe_events(
-                callback=self._on_matter_event,
-                event_filter=EventType.NODE_UPDATED,
-                node_filter=self._endpoint.node.node_id,
-            )
+            matter.subscribe_node_events(self._on_matter_event, node_id)
         )
         # subscribe to FeatureMap attribute (as that can dynamically change)
         self._unsubscribes.append(
-            self.matter_client.subscribe_events(
-                callback=self._on_featuremap_update,
-                event_filter=EventType.ATTRIBUTE_UPDATED,
-                node_filter=self._endpoint.node.node_id,
-                attr_path_filter=create_attribute_path(
+            matter.subscribe_attribute_events(
+                self._on_featuremap_update,
+                node_id,
+                create_attribute_path(
                     endpoint=self._endpoint.endpoint_id,
                     cluster_id=self._entity_info.primary_attribute.cluster_id,
                     attribute_id=FEATUREMAP_ATTRIBUTE_ID,
@@ -216,6 +216,24 @@ class MatterEntity(Entity):
             )
         )
 
+    async def async_will_remove_from_hass(self) -> None:
+        """Run when entity will be removed from hass."""
+        for unsub in self._unsubscribes:
+            with suppress(ValueError):
+                # suppress ValueError to prevent race conditions
+                unsub()
+        self._unsubscribes.clear()
+        if self._pending_state_write is not None:
+            self._pending_state_write.cancel()
+            self._pending_state_write = None
+
+    @callback
+    def rebind(self, matter_client: MatterClient, endpoint: MatterEndpoint) -> None:
+        """Bind the entity to the node (endpoint) of a reconnected client."""
+        self.matter_client = matter_client
+        self._endpoint = endpoint
+        self._entity_info = replace(self._entity_info, endpoint=endpoint)
+
     @cached_property
     def name(self) -> str | UndefinedType | None:
         """Return the name of the entity."""
@@ -230,6 +248,36 @@ class MatterEntity(Entity):
     @callback
     def _on_matter_event(self, event: EventType, data: Any = None) -> None:
         """Call on update from the device."""
+        if (delay := self._state_write_coalesce_delay) is None:
+            self._write_state_from_device()
+            return
+        if self._pending_state_write is not None:
+            # a state write is already scheduled which will pick up this update
+            return
+        if delay:
+            self._pending_state_write = self.hass.loop.call_later(
+                delay, self._flush_state_write
+            )
+        else:
+            self._pending_state_write = self.hass.loop.call_soon(
+                self._flush_state_write
+            )
+
+    @callback
+    def _flush_state_write(self) -> None:
+        """Write the state for all coalesced updates from the device."""
+        self._pending_state_write = None
+        self._write_state_from_device()
+
+    @callback
+    def async_mark_unavailable(self) -> None:
+        """Mark the entity unavailable, e.g. while disconnected from the server."""
+        self._attr_available = False
+        self.async_write_ha_state()
+
+    @callback
+    def _write_state_from_device(self) -> None:
+        """Update data from the Matter device and write the state."""
         self._attr_available = self._endpoint.node.available
         self._update_from_device()
         self.async_write_ha_state()
@@ -276,8 +324,11 @@ class MatterEntity(Entity):
         self, attribute: type[ClusterAttributeDescriptor]
     ) -> str:
         """Return AttributePath by providing the endpoint and Attribute class."""
-        return create_attribute_path(
-            self._endpoint.endpoint_id, attribute.cluster_id, attribute.attribute_id
+        # interned, as the same paths are kept by many entities and the event router
+        return sys.intern(
+            create_attribute_path(
+                self._endpoint.endpoint_id, attribute.cluster_id, attribute.attribute_id
+            )
         )
 
     @catch_matter_error
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-import logging
 from typing import Any
 
 from chip.clusters import Objects as clusters
@@ -25,7 +24,6 @@ from .helpers import get_matter
 from .models import MatterDiscoverySchema
 
 SwitchFeature = clusters.Switch.Bitmaps.Feature
-_LOGGER = logging.getLogger(__name__)
 
 EVENT_TYPES_MAP = {
     # mapping from raw event id's to translation keys
@@ -101,12 +99,12 @@ class MatterEventEntity(MatterEntity, EventEntity):
         """Handle being added to Home Assistant."""
         await super().async_added_to_hass()
 
-        # subscribe to NodeEvent events
+        # subscribe to NodeEvent events (of this endpoint only)
         self._unsubscribes.append(
-            self.matter_client.subscribe_events(
-                callback=self._on_matter_node_event,
-                event_filter=EventType.NODE_EVENT,
-                node_filter=self._endpoint.node.node_id,
+            get_matter(self.hass).subscribe_node_event_events(
+                self._on_matter_node_event,
+                self._endpoint.node.node_id,
+                self._endpoint.endpoint_id,
             )
         )
 
@@ -120,18 +118,8 @@ class MatterEventEntity(MatterEntity, EventEntity):
         data: MatterNodeEvent,
     ) -> None:
         """Call on NodeEvent."""
-        if data.endpoint_id != self._endpoint.endpoint_id:
-            return
-        raw_event_type = EVENT_TYPES_MAP.get(data.event_id, f"unknown_{data.event_id}")
-        _LOGGER.warning(
-            "Matter GenericSwitch raw event node=%s endpoint=%s event_id=%s raw_event=%s data=%s supported=%s",
-            self._endpoint.node.node_id,
-            data.endpoint_id,
-            data.event_id,
-            raw_event_type,
-            data.data,
-            self.event_types,
-        )
+        # NOTE: all node events are recorded in the adapter's event trace,
+        # which is available in the diagnostics
         if data.event_id == clusters.Switch.Events.MultiPressComplete.event_id:
             # multi press event
             presses = (data.data or {}).get("totalNumberOfPressesCounted", 1)
@@ -3,20 +3,31 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict, deque
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+import time
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry as dr
 
-from .const import DOMAIN, ID_TYPE_DEVICE_ID
+from .const import DOMAIN, ID_TYPE_DEVICE_ID, LOGGER
 
 if TYPE_CHECKING:
+    from chip.clusters.Objects import ClusterCommand
     from matter_server.client.models.node import MatterEndpoint, MatterNode
-    from matter_server.common.models import ServerInfoMessage
+    from matter_server.common.models import MatterNodeEvent, ServerInfoMessage
 
     from .adapter import MatterAdapter
+    from .entity import MatterEntity
+    from .models import MatterDeviceInfo
+
+DEVICE_INFO_CACHE_SIZE = 256
+EVENT_TRACE_SIZE = 250
+# max number of node events traced per node per second
+EVENT_TRACE_RATE_LIMIT = 10
 
 
 class MissingNode(HomeAssistantError):
@@ -29,6 +40,153 @@ class MatterEntryData:
 
     adapter: MatterAdapter
     listen_task: asyncio.Task
+    # a warm reconnect to the server is in progress
+    reconnecting: bool = False
+
+
+class MatterDeviceInfoCache:
+    """LRU cache of MatterDeviceInfo by HA device id.
+
+    Entries are invalidated per node when the node is updated or removed.
+    """
+
+    def __init__(self, maxsize: int = DEVICE_INFO_CACHE_SIZE) -> None:
+        """Initialize the cache."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[str, tuple[int, MatterDeviceInfo]] = OrderedDict()
+
+    @callback
+    def get(self, device_id: str) -> MatterDeviceInfo | None:
+        """Return the cached device info for a HA device id."""
+        if (entry := self._data.get(device_id)) is None:
+            self.misses += 1
+            return None
+        self._data.move_to_end(device_id)
+        self.hits += 1
+        return entry[1]
+
+    @callback
+    def set(
+        self, device_id: str, node_id: int, device_info: MatterDeviceInfo
+    ) -> None:
+        """Store the device info for a HA device id, evicting the oldest entry."""
+        self._data[device_id] = (node_id, device_info)
+        self._data.move_to_end(device_id)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    @callback
+    def invalidate_node(self, node_id: int) -> None:
+        """Remove all cached device info of a node."""
+        for device_id in [
+            device_id
+            for device_id, (entry_node_id, _) in self._data.items()
+            if entry_node_id == node_id
+        ]:
+            del self._data[device_id]
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the cache statistics."""
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class MatterEventTrace:
+    """Ring buffer with a structured trace of the received node events.
+
+    Used to troubleshoot (button) events through diagnostics,
+    instead of logging every single event. Tracing is rate limited per node,
+    so a chatty device can not flush the events of all other devices.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = EVENT_TRACE_SIZE,
+        rate_limit: int = EVENT_TRACE_RATE_LIMIT,
+    ) -> None:
+        """Initialize the event trace."""
+        self.rate_limit = rate_limit
+        self.dropped = 0
+        self._events: deque[dict[str, Any]] = deque(maxlen=maxsize)
+        # node_id -> (start of the current second, events traced within it)
+        self._rate: dict[int, tuple[float, int]] = {}
+
+    @callback
+    def record(self, node_event: MatterNodeEvent) -> None:
+        """Add a node event to the trace."""
+        now = time.time()
+        window_start, count = self._rate.get(node_event.node_id, (0.0, 0))
+        if now - window_start >= 1:
+            window_start, count = now, 0
+        if count >= self.rate_limit:
+            self.dropped += 1
+            return
+        self._rate[node_event.node_id] = (window_start, count + 1)
+        self._events.append(
+            {
+                "timestamp": now,
+                "node_id": node_event.node_id,
+                "endpoint_id": node_event.endpoint_id,
+                "cluster_id": node_event.cluster_id,
+                "event_id": node_event.event_id,
+                "event_number": node_event.event_number,
+                "data": node_event.data,
+            }
+        )
+
+    @callback
+    def forget_node(self, node_id: int) -> None:
+        """Drop the rate limit state of a removed node."""
+        self._rate.pop(node_id, None)
+
+    def as_dict(self, node_id: int | None = None) -> dict[str, Any]:
+        """Return the trace, optionally only for a single node."""
+        return {
+            "maxsize": self._events.maxlen,
+            "rate_limit": self.rate_limit,
+            "dropped": self.dropped,
+            "events": [
+                event
+                for event in self._events
+                if node_id is None or event["node_id"] == node_id
+            ],
+        }
+
+
+async def async_send_device_commands(
+    entity: MatterEntity,
+    commands: Sequence[ClusterCommand],
+    pipelined: bool = False,
+) -> None:
+    """Send commands to the endpoint of the entity, logging the latency.
+
+    The commands are sent one after the other, each once the previous one
+    got its response. Pipelined commands are sent all at once (in order),
+    without waiting for the response to the previous command.
+    Commands to many entities are sent concurrently by the entity service
+    calls themselves, so every call sends its commands without any batching.
+    """
+    start = time.monotonic()
+    if pipelined and len(commands) > 1:
+        await asyncio.gather(
+            *(entity.send_device_command(command) for command in commands)
+        )
+    else:
+        for command in commands:
+            await entity.send_device_command(command)
+    LOGGER.debug(
+        "Sent %s command(s)%s to %s in %.1f ms",
+        len(commands),
+        " pipelined" if pipelined else "",
+        entity.entity_id,
+        (time.monotonic() - start) * 1000,
+    )
 
 
 @callback
@@ -102,8 +260,16 @@ def get_node_from_device_entry(
     if device_id_full is None:
         return None
 
-    device_id = device_id_full.lstrip(device_id_type_prefix)
+    device_id = device_id_full.removeprefix(device_id_type_prefix)
     matter_client = matter.matter_client
+
+    # fast path: the adapter keeps a reverse index of the device ids it created
+    if (location := matter.get_device_id_location(device_id)) is not None:
+        try:
+            return matter_client.get_node(location[0])
+        except KeyError:
+            pass  # race condition, the node was just removed
+
     server_info = matter_client.server_info
 
     if server_info is None:
@@ -0,0 +1,219 @@
+"""Rate limited interview scheduler for Matter nodes."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+from enum import IntEnum, StrEnum
+import heapq
+import itertools
+import time
+from typing import TYPE_CHECKING, Any
+
+from chip.clusters import Objects as clusters
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import LOGGER
+
+if TYPE_CHECKING:
+    from matter_server.client import MatterClient
+    from matter_server.client.models.node import MatterNode
+
+NetworkFeature = clusters.NetworkCommissioning.Bitmaps.Feature
+
+# number of interview durations kept for the metrics
+INTERVIEW_DURATION_HISTORY = 50
+
+
+class InterviewPriority(IntEnum):
+    """Priority of an interview request (lower is sooner)."""
+
+    # explicitly requested by a user (e.g. from the UI)
+    HIGH = 0
+    NORMAL = 1
+    # bulk or automated requests
+    LOW = 2
+
+
+class NodeNetwork(StrEnum):
+    """Network type of a Matter node."""
+
+    THREAD = "thread"
+    WIFI = "wifi"
+    ETHERNET = "ethernet"
+    UNKNOWN = "unknown"
+
+
+# max number of concurrent interviews per network type,
+# Thread is the most constrained as all traffic goes through the border router(s)
+INTERVIEW_CONCURRENCY = {
+    NodeNetwork.THREAD: 1,
+    NodeNetwork.WIFI: 3,
+    NodeNetwork.ETHERNET: 3,
+    NodeNetwork.UNKNOWN: 1,
+}
+
+
+def get_node_network(node: MatterNode) -> NodeNetwork:
+    """Return the network type of the node (from its NetworkCommissioning cluster)."""
+    feature_map = node.get_attribute_value(
+        0, None, clusters.NetworkCommissioning.Attributes.FeatureMap
+    )
+    if not isinstance(feature_map, int):
+        return NodeNetwork.UNKNOWN
+    if feature_map & NetworkFeature.kThreadNetworkInterface:
+        return NodeNetwork.THREAD
+    if feature_map & NetworkFeature.kWiFiNetworkInterface:
+        return NodeNetwork.WIFI
+    if feature_map & NetworkFeature.kEthernetNetworkInterface:
+        return NodeNetwork.ETHERNET
+    return NodeNetwork.UNKNOWN
+
+
+@dataclass(slots=True)
+class _InterviewRequest:
+    """A pending or running interview of a node."""
+
+    node_id: int
+    network: NodeNetwork
+    priority: InterviewPriority
+    future: asyncio.Future[None]
+    queued: float = field(default_factory=time.monotonic)
+    started: bool = False
+
+
+class MatterInterviewScheduler:
+    """Queue node interviews with priorities and per network concurrency caps.
+
+    Requests for a node which is already queued or being interviewed
+    share the pending interview (a queued request is moved up if needed).
+    """
+
+    def __init__(self, hass: HomeAssistant, matter_client: MatterClient) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self.matter_client = matter_client
+        self._requests: dict[int, _InterviewRequest] = {}
+        # per network heap of (priority, sequence, node_id)
+        self._queues: dict[NodeNetwork, list[tuple[int, int, int]]] = {
+            network: [] for network in NodeNetwork
+        }
+        self._running: dict[NodeNetwork, int] = dict.fromkeys(NodeNetwork, 0)
+        self._sequence = itertools.count()
+        self._tasks: set[asyncio.Task] = set()
+        self.completed = 0
+        self.failed = 0
+        self.deduplicated = 0
+        self._durations: deque[float] = deque(maxlen=INTERVIEW_DURATION_HISTORY)
+        self._wait_times: deque[float] = deque(maxlen=INTERVIEW_DURATION_HISTORY)
+
+    async def async_interview(
+        self, node_id: int, priority: InterviewPriority = InterviewPriority.NORMAL
+    ) -> None:
+        """Queue an interview of the node and wait for it to complete."""
+        if (request := self._requests.get(node_id)) is not None:
+            self.deduplicated += 1
+            if priority < request.priority and not request.started:
+                # move the queued request up, the outdated heap entry is skipped
+                request.priority = priority
+                self._push(request)
+                self._async_process_queue(request.network)
+            await asyncio.shield(request.future)
+            return
+        try:
+            network = get_node_network(self.matter_client.get_node(node_id))
+        except KeyError:
+            network = NodeNetwork.UNKNOWN
+        request = _InterviewRequest(
+            node_id, network, priority, self.hass.loop.create_future()
+        )
+        self._requests[node_id] = request
+        self._push(request)
+        self._async_process_queue(network)
+        await asyncio.shield(request.future)
+
+    @callback
+    def async_cancel_all(self) -> None:
+        """Cancel all queued and running interviews."""
+        for task in self._tasks:
+            task.cancel()
+        for request in self._requests.values():
+            if not request.future.done():
+                request.future.cancel()
+        self._requests.clear()
+        for queue in self._queues.values():
+            queue.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the scheduler metrics."""
+        return {
+            "queue_depth": {
+                network: sum(
+                    1
+                    for request in self._requests.values()
+                    if request.network == network and not request.started
+                )
+                for network in NodeNetwork
+            },
+            "running": dict(self._running),
+            "concurrency": dict(INTERVIEW_CONCURRENCY),
+            "completed": self.completed,
+            "failed": self.failed,
+            "deduplicated": self.deduplicated,
+            "interview_durations": list(self._durations),
+            "wait_times": list(self._wait_times),
+        }
+
+    def _push(self, request: _InterviewRequest) -> None:
+        """Add the request to the queue of its network."""
+        heapq.heappush(
+            self._queues[request.network],
+            (request.priority, next(self._sequence), request.node_id),
+        )
+
+    @callback
+    def _async_process_queue(self, network: NodeNetwork) -> None:
+        """Start queued interviews as long as the network has capacity."""
+        queue = self._queues[network]
+        while queue and self._running[network] < INTERVIEW_CONCURRENCY[network]:
+            priority, _, node_id = heapq.heappop(queue)
+            request = self._requests.get(node_id)
+            if request is None or request.started or request.priority != priority:
+                # outdated entry (request moved up or already started)
+                continue
+            self._wait_times.append(time.monotonic() - request.queued)
+            request.started = True
+            self._running[network] += 1
+            task = self.hass.async_create_background_task(
+                self._async_run(request), f"matter interview node {node_id}"
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _async_run(self, request: _InterviewRequest) -> None:
+        """Interview a node and resolve its request."""
+        start = time.monotonic()
+        try:
+            await self.matter_client.interview_node(node_id=request.node_id)
+        except Exception as err:  # noqa: BLE001
+            self.failed += 1
+            if not request.future.done():
+                request.future.set_exception(err)
+        else:
+            self.completed += 1
+            if not request.future.done():
+                request.future.set_result(None)
+        finally:
+            self._durations.append(time.monotonic() - start)
+            LOGGER.debug(
+                "Interview of node %s (%s) finished in %.1f s",
+                request.node_id,
+                request.network,
+                self._durations[-1],
+            )
+            self._running[request.network] -= 1
+            if self._requests.get(request.node_id) is request:
+                del self._requests[request.node_id]
+            self._async_process_queue(request.network)
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from chip.clusters import Objects as clusters
-from chip.clusters.Objects import NullValue
+from chip.clusters.Objects import ClusterCommand, NullValue
 from matter_server.client.models import device_types
 
 from homeassistant.components.light import (
@@ -29,9 +29,9 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.util import color as color_util
 
-from .const import LOGGER
+from .const import CONF_COMMAND_PIPELINING, LOGGER
 from .entity import MatterEntity, MatterEntityDescription
-from .helpers import get_matter
+from .helpers import async_send_device_commands, get_matter
 from .models import MatterDiscoverySchema
 from .util import (
     convert_to_hass_hs,
@@ -75,6 +75,16 @@ TRANSITION_BLOCKLIST = (
     (5245, 1412, "1.0", "1.0.21"),
 )
 
+# color and level commands can be pipelined (sent without awaiting
+# the response to the color command), which is safe because color commands
+# are sent with ExecuteIfOff and thus do not depend on the on/off state.
+# As devices may drop or misorder commands received back-to-back,
+# pipelining is opt-in through the integration options and never used
+# for devices on the transition blocklist and the models listed below.
+# vendorid (attributeKey 0/40/2)
+# productid (attributeKey 0/40/4)
+PIPELINE_BLOCKLIST: tuple[tuple[int, int], ...] = ()
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -99,71 +109,70 @@ class MatterLight(MatterEntity, LightEntity):
     _supports_color = False
     _supports_color_temperature = False
     _transitions_disabled = False
+    _pipelining_disabled = False
     _platform_translation_key = "light"
+    # lights report CurrentX/CurrentY/CurrentLevel/ColorMode etc. in one burst
+    _state_write_coalesce_delay = 0
     _attr_min_color_temp_kelvin = DEFAULT_MIN_KELVIN
     _attr_max_color_temp_kelvin = DEFAULT_MAX_KELVIN
 
-    async def _set_xy_color(
+    def _xy_color_command(
         self, xy_color: tuple[float, float], transition: float = 0.0
-    ) -> None:
-        """Set xy color."""
+    ) -> clusters.ColorControl.Commands.MoveToColor:
+        """Return the command to set xy color."""
 
         matter_xy = convert_to_matter_xy(xy_color)
 
-        await self.send_device_command(
-            clusters.ColorControl.Commands.MoveToColor(
-                colorX=int(matter_xy[0]),
-                colorY=int(matter_xy[1]),
-                # transition in matter is measured in tenths of a second
-                transitionTime=int(transition * 10),
-                # allow setting the color while the light is off,
-                # by setting the optionsMask to 1 (=ExecuteIfOff)
-                optionsMask=1,
-                optionsOverride=1,
-            )
+        return clusters.ColorControl.Commands.MoveToColor(
+            colorX=int(matter_xy[0]),
+            colorY=int(matter_xy[1]),
+            # transition in matter is measured in tenths of a second
+            transitionTime=int(transition * 10),
+            # allow setting the color while the light is off,
+            # by setting the optionsMask to 1 (=ExecuteIfOff)
+            optionsMask=1,
+            optionsOverride=1,
         )
 
-    async def _set_hs_color(
+    def _hs_color_command(
         self, hs_color: tuple[float, float], transition: float = 0.0
-    ) -> None:
-        """Set hs color."""
+    ) -> clusters.ColorControl.Commands.MoveToHueAndSaturation:
+        """Return the command to set hs color."""
 
         matter_hs = convert_to_matter_hs(hs_color)
 
-        await self.send_device_command(
-            clusters.ColorControl.Commands.MoveToHueAndSaturation(
-                hue=int(matter_hs[0]),
-                saturation=int(matter_hs[1]),
-                # transition in matter is measured in tenths of a second
-                transitionTime=int(transition * 10),
-                # allow setting the color while the light is off,
-                # by setting the optionsMask to 1 (=ExecuteIfOff)
-                optionsMask=1,
-                optionsOverride=1,
-            )
+        return clusters.ColorControl.Commands.MoveToHueAndSaturation(
+            hue=int(matter_hs[0]),
+            saturation=int(matter_hs[1]),
+            # transition in matter is measured in tenths of a second
+            transitionTime=int(transition * 10),
+            # allow setting the color while the light is off,
+            # by setting the optionsMask to 1 (=ExecuteIfOff)
+            optionsMask=1,
+            optionsOverride=1,
         )
 
-    async def _set_color_temp(
+    def _color_temp_command(
         self, color_temp_kelvin: int, transition: float = 0.0
-    ) -> None:
-        """Set color temperature."""
+    ) -> clusters.ColorControl.Commands.MoveToColorTemperature:
+        """Return the command to set color temperature."""
         color_temp_mired = color_util.color_temperature_kelvin_to_mired(
             color_temp_kelvin
         )
-        await self.send_device_command(
-            clusters.ColorControl.Commands.MoveToColorTemperature(
-                colorTemperatureMireds=color_temp_mired,
-                # transition in matter is measured in tenths of a second
-                transitionTime=int(transition * 10),
-                # allow setting the color while the light is off,
-                # by setting the optionsMask to 1 (=ExecuteIfOff)
-                optionsMask=1,
-                optionsOverride=1,
-            )
+        return clusters.ColorControl.Commands.MoveToColorTemperature(
+            colorTemperatureMireds=color_temp_mired,
+            # transition in matter is measured in tenths of a second
+            transitionTime=int(transition * 10),
+            # allow setting the color while the light is off,
+            # by setting the optionsMask to 1 (=ExecuteIfOff)
+            optionsMask=1,
+            optionsOverride=1,
         )
 
-    async def _set_brightness(self, brightness: int, transition: float = 0.0) -> None:
-        """Set brightness."""
+    def _brightness_command(
+        self, brightness: int, transition: float = 0.0
+    ) -> clusters.LevelControl.Commands.MoveToLevelWithOnOff:
+        """Return the command to set brightness."""
 
         level_control = self._endpoint.get_cluster(clusters.LevelControl)
 
@@ -177,12 +186,10 @@ class MatterLight(MatterEntity, LightEntity):
             )
         )
 
-        await self.send_device_command(
-            clusters.LevelControl.Commands.MoveToLevelWithOnOff(
-                level=level,
-                # transition in matter is measured in tenths of a second
-                transitionTime=int(transition * 10),
-            )
+        return clusters.LevelControl.Commands.MoveToLevelWithOnOff(
+            level=level,
+            # transition in matter is measured in tenths of a second
+            transitionTime=int(transition * 10),
         )
 
     def _get_xy_color(self) -> tuple[float, float]:
@@ -304,30 +311,30 @@ class MatterLight(MatterEntity, LightEntity):
         if self._transitions_disabled:
             transition = 0
 
+        commands: list[ClusterCommand] = []
         if self.supported_color_modes is not None:
             if hs_color is not None and ColorMode.HS in self.supported_color_modes:
-                await self._set_hs_color(hs_color, transition)
+                commands.append(self._hs_color_command(hs_color, transition))
             elif xy_color is not None and ColorMode.XY in self.supported_color_modes:
-                await self._set_xy_color(xy_color, transition)
+                commands.append(self._xy_color_command(xy_color, transition))
             elif (
                 color_temp_kelvin is not None
                 and ColorMode.COLOR_TEMP in self.supported_color_modes
             ):
-                await self._set_color_temp(color_temp_kelvin, transition)
+                commands.append(self._color_temp_command(color_temp_kelvin, transition))
 
         if brightness is not None and self._supports_brightness:
-            await self._set_brightness(brightness, transition)
-            return
+            commands.append(self._brightness_command(brightness, transition))
+        else:
+            commands.append(clusters.OnOff.Commands.On())
 
-        await self.send_device_command(
-            clusters.OnOff.Commands.On(),
+        await async_send_device_commands(
+            self, commands, pipelined=self._command_pipelining_enabled()
         )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn light off."""
-        await self.send_device_command(
-            clusters.OnOff.Commands.Off(),
-        )
+        await async_send_device_commands(self, [clusters.OnOff.Commands.Off()])
 
     @callback
     def _update_from_device(self) -> None:
@@ -394,6 +401,7 @@ class MatterLight(MatterEntity, LightEntity):
             supported_color_modes = filter_supported_color_modes(supported_color_modes)
             self._attr_supported_color_modes = supported_color_modes
             self._check_transition_blocklist()
+            self._check_pipeline_blocklist()
             # flag support for transition as soon as we support setting brightness and/or color
             if (
                 supported_color_modes != {ColorMode.ONOFF}
@@ -459,6 +467,30 @@ class MatterLight(MatterEntity, LightEntity):
                 "with light transitions. Transitions will be disabled for this light"
             )
 
+    def _check_pipeline_blocklist(self) -> None:
+        """Check if this device needs its commands sent one after the other."""
+        device_info = self._endpoint.device_info
+        if self._transitions_disabled or (
+            device_info.vendorID,
+            device_info.productID,
+        ) in PIPELINE_BLOCKLIST:
+            # firmware with known light command issues is not sent pipelined commands
+            self._pipelining_disabled = True
+            LOGGER.debug(
+                "Pipelined light commands disabled for node %s endpoint %s (%s)",
+                self._endpoint.node.node_id,
+                self._endpoint.endpoint_id,
+                device_info.productName,
+            )
+
+    def _command_pipelining_enabled(self) -> bool:
+        """Return if the color and level commands may be pipelined."""
+        if self._pipelining_disabled:
+            return False
+        return get_matter(self.hass).config_entry.options.get(
+            CONF_COMMAND_PIPELINING, False
+        )
+
 
 # Discovery schema(s) to map Matter Attributes to HA entities
 DISCOVERY_SCHEMAS = [
@@ -69,12 +69,12 @@ class MatterLock(MatterEntity, LockEntity):
     async def async_added_to_hass(self) -> None:
         """Subscribe to events."""
         await super().async_added_to_hass()
-        # subscribe to NodeEvent events
+        # subscribe to NodeEvent events (of this endpoint only)
         self._unsubscribes.append(
-            self.matter_client.subscribe_events(
-                callback=self._on_matter_node_event,
-                event_filter=EventType.NODE_EVENT,
-                node_filter=self._endpoint.node.node_id,
+            get_matter(self.hass).subscribe_node_event_events(
+                self._on_matter_node_event,
+                self._endpoint.node.node_id,
+                self._endpoint.endpoint_id,
             )
         )
 
@@ -85,9 +85,7 @@ class MatterLock(MatterEntity, LockEntity):
         node_event: MatterNodeEvent,
     ) -> None:
         """Call on NodeEvent."""
-        if (node_event.endpoint_id != self._endpoint.endpoint_id) or (
-            node_event.cluster_id != clusters.DoorLock.id
-        ):
+        if node_event.cluster_id != clusters.DoorLock.id:
             return
 
         LOGGER.debug(
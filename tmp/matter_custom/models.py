@@ -41,7 +41,7 @@ class MatterDeviceInfo(TypedDict):
     product_id: str  # productId hex string
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MatterEntityInfo:
     """Info discovered from (primary) Matter Attribute to create entity."""
 
@@ -52,7 +52,7 @@ class MatterEntityInfo:
     platform: Platform
 
     # All attributes that need to be watched by entity (incl. primary)
-    attributes_to_watch: list[type[ClusterAttributeDescriptor]]
+    attributes_to_watch: tuple[type[ClusterAttributeDescriptor], ...]
 
     # the entity description to use
     entity_description: MatterEntityDescription
@@ -69,7 +69,21 @@ class MatterEntityInfo:
         return self.attributes_to_watch[0]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class MatterDiscoveryReads:
+    """What the discovery schemas of a primary cluster read of an endpoint."""
+
+    # (cluster_id, attribute_id) of the attributes of which the presence is read
+    present: tuple[tuple[int, int], ...]
+    # (cluster_id, attribute_id) of the attributes which must not be null
+    non_null: tuple[tuple[int, int], ...]
+    # (cluster_id, attribute_id) of the attributes of which the value is matched
+    values: tuple[tuple[int, int], ...]
+    # cluster_ids of which the presence on the node is read
+    node_clusters: tuple[int, ...]
+
+
+@dataclass(frozen=True, slots=True)
 class MatterDiscoverySchema:
     """Matter discovery schema.
 
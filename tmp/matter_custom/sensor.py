@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, cast
+from functools import cache
+from typing import TYPE_CHECKING, Any, cast
 
 from chip.clusters import Objects as clusters
 from chip.clusters.ClusterObjects import ClusterAttributeDescriptor
@@ -16,6 +18,7 @@ from matter_server.common.custom_clusters import (
     NeoCluster,
     ThirdRealityMeteringCluster,
 )
+from propcache.api import cached_property
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -222,6 +225,41 @@ def matter_epoch_microseconds_to_utc(x: int | None) -> datetime | None:
     return dt_util.utc_from_timestamp(seconds + MATTER_2000_TO_UNIX_EPOCH_OFFSET)
 
 
+@cache
+def fixed_point(divisor: int) -> Callable[[float], float]:
+    """Return the (shared) converter for a fixed point value with given divisor."""
+
+    def convert(x: float) -> float:
+        return x / divisor
+
+    return convert
+
+
+def compile_value_converter(
+    device_to_ha: Callable[[Any], Any] | None,
+) -> Callable[[Any], Any]:
+    """Return a single callable to convert a raw attribute value to the HA value.
+
+    Resolved once per entity, so an attribute update only needs a single call,
+    including the handling of absent (None/null) values.
+    """
+    if device_to_ha is None:
+
+        def convert(value: Any) -> Any:
+            if value is None or isinstance(value, Nullable):
+                return None
+            return value
+
+    else:
+
+        def convert(value: Any) -> Any:
+            if value is None or isinstance(value, Nullable):
+                return None
+            return device_to_ha(value)
+
+    return convert
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -266,16 +304,18 @@ class MatterSensor(MatterEntity, SensorEntity):
 
     entity_description: MatterSensorEntityDescription
 
+    @cached_property
+    def _value_converter(self) -> Callable[[Any], Any]:
+        """Return the converter for the primary attribute value."""
+        return compile_value_converter(self.entity_description.device_to_ha)
+
     @callback
     def _update_from_device(self) -> None:
         """Update from device."""
-        value: Nullable | float | None
-        value = self.get_matter_attribute_value(self._entity_info.primary_attribute)
-        if value in (None, NullValue):
-            value = None
-        elif value_convert := self.entity_description.device_to_ha:
-            value = value_convert(value)
-        self._attr_native_value = value
+        value = self._endpoint.get_attribute_value(
+            None, self._entity_info.primary_attribute
+        )
+        self._attr_native_value = self._value_converter(value)
 
 
 class MatterDraftElectricalMeasurementSensor(MatterEntity, SensorEntity):
@@ -375,7 +415,7 @@ DISCOVERY_SCHEMAS = [
             key="TemperatureSensor",
             native_unit_of_measurement=UnitOfTemperature.CELSIUS,
             device_class=SensorDeviceClass.TEMPERATURE,
-            device_to_ha=lambda x: x / TEMPERATURE_SCALING_FACTOR,
+            device_to_ha=fixed_point(TEMPERATURE_SCALING_FACTOR),
             state_class=SensorStateClass.MEASUREMENT,
         ),
         entity_class=MatterSensor,
@@ -387,7 +427,7 @@ DISCOVERY_SCHEMAS = [
             key="PressureSensor",
             native_unit_of_measurement=UnitOfPressure.KPA,
             device_class=SensorDeviceClass.PRESSURE,
-            device_to_ha=lambda x: x / 10,
+            device_to_ha=fixed_point(10),
             state_class=SensorStateClass.MEASUREMENT,
         ),
         entity_class=MatterSensor,
@@ -399,7 +439,7 @@ DISCOVERY_SCHEMAS = [
             key="FlowSensor",
             native_unit_of_measurement=UnitOfVolumeFlowRate.CUBIC_METERS_PER_HOUR,
             translation_key="flow",
-            device_to_ha=lambda x: x / 10,
+            device_to_ha=fixed_point(10),
             state_class=SensorStateClass.MEASUREMENT,
         ),
         entity_class=MatterSensor,
@@ -411,7 +451,7 @@ DISCOVERY_SCHEMAS = [
             key="HumiditySensor",
             native_unit_of_measurement=PERCENTAGE,
             device_class=SensorDeviceClass.HUMIDITY,
-            device_to_ha=lambda x: x / HUMIDITY_SCALING_FACTOR,
+            device_to_ha=fixed_point(HUMIDITY_SCALING_FACTOR),
             state_class=SensorStateClass.MEASUREMENT,
         ),
         entity_class=MatterSensor,
@@ -779,7 +819,7 @@ DISCOVERY_SCHEMAS = [
             native_unit_of_measurement=UnitOfPower.WATT,
             suggested_display_precision=2,
             state_class=SensorStateClass.MEASUREMENT,
-            device_to_ha=lambda x: x / 1000,
+            device_to_ha=fixed_point(1000),
         ),
         entity_class=MatterSensor,
         required_attributes=(
@@ -796,7 +836,7 @@ DISCOVERY_SCHEMAS = [
             native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
             suggested_display_precision=3,
             state_class=SensorStateClass.TOTAL_INCREASING,
-            device_to_ha=lambda x: x / 1000,
+            device_to_ha=fixed_point(1000),
         ),
         entity_class=MatterSensor,
         required_attributes=(
@@ -813,7 +853,7 @@ DISCOVERY_SCHEMAS = [
             native_unit_of_measurement=UnitOfPower.WATT,
             suggested_display_precision=2,
             state_class=SensorStateClass.MEASUREMENT,
-            device_to_ha=lambda x: x / 10,
+            device_to_ha=fixed_point(10),
         ),
         entity_class=MatterSensor,
         required_attributes=(NeoCluster.Attributes.Watt,),
@@ -842,7 +882,7 @@ DISCOVERY_SCHEMAS = [
             native_unit_of_measurement=UnitOfElectricPotential.VOLT,
             suggested_display_precision=0,
             state_class=SensorStateClass.MEASUREMENT,
-            device_to_ha=lambda x: x / 10,
+            device_to_ha=fixed_point(10),
         ),
         entity_class=MatterSensor,
         required_attributes=(NeoCluster.Attributes.Voltage,),
@@ -1244,7 +1284,7 @@ DISCOVERY_SCHEMAS = [
             key="ThermostatLocalTemperature",
             native_unit_of_measurement=UnitOfTemperature.CELSIUS,
             device_class=SensorDeviceClass.TEMPERATURE,
-            device_to_ha=lambda x: x / TEMPERATURE_SCALING_FACTOR,
+            device_to_ha=fixed_point(TEMPERATURE_SCALING_FACTOR),
             state_class=SensorStateClass.MEASUREMENT,
         ),
         entity_class=MatterSensor,
@@ -0,0 +1,277 @@
+"""Persisted snapshot of the Matter discovery results."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import cache
+import hashlib
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, LOGGER
+from .discovery import DISCOVERY_SCHEMAS
+from .models import UNSET, MatterDiscoverySchema, MatterEntityInfo
+
+if TYPE_CHECKING:
+    from chip.clusters.Objects import ClusterAttributeDescriptor
+    from matter_server.client.models.node import MatterEndpoint
+
+STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 30
+
+# compact discovery result: platform, position of the schema within
+# the platform schemas and the positions of the watched optional attributes
+type SnapshotEntity = tuple[str, int, list[int]]
+
+
+def _attribute_ids(
+    attributes: Iterable[type[ClusterAttributeDescriptor]] | None,
+) -> list[tuple[int, int]] | None:
+    """Return the (cluster_id, attribute_id) of schema attributes."""
+    if attributes is None:
+        return None
+    return [(attribute.cluster_id, attribute.attribute_id) for attribute in attributes]
+
+
+def _schema_signature_data(schema: MatterDiscoverySchema) -> tuple[Any, ...]:
+    """Return the (restart stable) parts of a schema which affect discovery."""
+    return (
+        schema.entity_description.key,
+        f"{schema.entity_class.__module__}.{schema.entity_class.__qualname__}",
+        _attribute_ids(schema.required_attributes),
+        _attribute_ids(schema.optional_attributes),
+        _attribute_ids(schema.absent_attributes),
+        [cluster.id for cluster in schema.absent_clusters or ()],
+        [
+            getattr(device_type, "device_type", device_type)
+            for device_type in schema.device_type or ()
+        ],
+        [
+            getattr(device_type, "device_type", device_type)
+            for device_type in schema.not_device_type or ()
+        ],
+        schema.vendor_id,
+        schema.product_id,
+        schema.product_name,
+        schema.endpoint_id,
+        schema.featuremap_contains,
+        schema.allow_multi,
+        schema.allow_none_value,
+        *(
+            None if value is UNSET else repr(value)
+            for value in (
+                schema.value_contains,
+                schema.secondary_value_contains,
+                schema.value_is_not,
+                schema.secondary_value_is_not,
+            )
+        ),
+    )
+
+
+@cache
+def get_platform_signature(platform: Platform) -> str:
+    """Return a signature of the discovery schemas of a (loaded) platform.
+
+    A snapshot entity is only valid for the exact same platform schemas,
+    including their entity class and filters.
+    """
+    return hashlib.blake2b(
+        repr(
+            [_schema_signature_data(schema) for schema in DISCOVERY_SCHEMAS[platform]]
+        ).encode(),
+        digest_size=8,
+    ).hexdigest()
+
+
+@cache
+def _get_schema_positions(platform: Platform) -> dict[int, int]:
+    """Return id(schema) -> position of the schemas of a (loaded) platform."""
+    return {
+        id(schema): position
+        for position, schema in enumerate(DISCOVERY_SCHEMAS[platform])
+    }
+
+
+def entity_info_to_snapshot(entity_info: MatterEntityInfo) -> SnapshotEntity:
+    """Return the compact (snapshot) form of a discovery result."""
+    schema = entity_info.discovery_schema
+    optional_attributes = schema.optional_attributes or ()
+    return (
+        schema.platform,
+        _get_schema_positions(schema.platform)[id(schema)],
+        [
+            optional_attributes.index(attribute)
+            for attribute in entity_info.attributes_to_watch
+            if attribute not in schema.required_attributes
+        ],
+    )
+
+
+def entity_info_from_snapshot(
+    endpoint: MatterEndpoint, snapshot_entity: SnapshotEntity
+) -> MatterEntityInfo:
+    """Return the discovery result from its compact (snapshot) form."""
+    platform, position, optional_positions = snapshot_entity
+    schema = DISCOVERY_SCHEMAS[Platform(platform)][position]
+    optional_attributes = schema.optional_attributes or ()
+    return MatterEntityInfo(
+        endpoint=endpoint,
+        platform=schema.platform,
+        attributes_to_watch=(
+            *schema.required_attributes,
+            *(optional_attributes[position] for position in optional_positions),
+        ),
+        entity_description=schema.entity_description,
+        entity_class=schema.entity_class,
+        discovery_schema=schema,
+    )
+
+
+def _get_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the storage of the snapshot of a config entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.discovery_snapshot")
+
+
+async def async_remove_snapshot(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove the stored snapshot of a (removed) config entry."""
+    await _get_store(hass, entry_id).async_remove()
+
+
+@dataclass(slots=True)
+class _EndpointSnapshot:
+    """Discovery results of an endpoint."""
+
+    fingerprint: int
+    # platform -> signature of the platform schemas used
+    signatures: dict[str, str]
+    entities: list[SnapshotEntity]
+
+
+class MatterDiscoverySnapshot:
+    """Discovery results per endpoint, keyed by the endpoint fingerprint.
+
+    Persisted so entities can be created on startup without running
+    discovery for the endpoints of which the discovery inputs did not change.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the snapshot."""
+        self._store: Store[dict[str, Any]] | None = None
+        # node_id -> endpoint_id -> snapshot of the endpoint
+        self._endpoints: dict[int, dict[int, _EndpointSnapshot]] = {}
+
+    async def async_load(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Load the snapshot of the config entry from storage."""
+        self._store = _get_store(hass, entry_id)
+        if not (data := await self._store.async_load()):
+            return
+        try:
+            self._endpoints = {
+                int(node_id): {
+                    int(endpoint_id): _EndpointSnapshot(
+                        endpoint["fingerprint"],
+                        endpoint["signatures"],
+                        [tuple(entity) for entity in endpoint["entities"]],
+                    )
+                    for endpoint_id, endpoint in endpoints.items()
+                }
+                for node_id, endpoints in data["nodes"].items()
+            }
+        except (KeyError, TypeError, ValueError):
+            # unknown (older) format, it is only a cache so start over
+            LOGGER.debug("Ignoring the discovery snapshot in an unknown format")
+            self._endpoints = {}
+
+    @callback
+    def get(
+        self, endpoint: MatterEndpoint, fingerprint: int
+    ) -> list[MatterEntityInfo] | None:
+        """Return the discovery results of the endpoint, if its fingerprint matches.
+
+        The platforms of the discovery results must be loaded.
+        """
+        snapshot = self._endpoints.get(endpoint.node.node_id, {}).get(
+            endpoint.endpoint_id
+        )
+        if snapshot is None or snapshot.fingerprint != fingerprint:
+            return None
+        try:
+            if any(
+                get_platform_signature(Platform(platform)) != signature
+                for platform, signature in snapshot.signatures.items()
+            ):
+                # the platform schemas changed since the snapshot was taken
+                return None
+            return [
+                entity_info_from_snapshot(endpoint, snapshot_entity)
+                for snapshot_entity in snapshot.entities
+            ]
+        except (IndexError, KeyError, TypeError, ValueError):
+            # corrupt snapshot, run the regular discovery
+            return None
+
+    @callback
+    def update(
+        self,
+        endpoint: MatterEndpoint,
+        fingerprint: int,
+        entity_infos: list[MatterEntityInfo],
+    ) -> None:
+        """Update the discovery results of the endpoint."""
+        snapshot = _EndpointSnapshot(
+            fingerprint,
+            {
+                entity_info.platform: get_platform_signature(entity_info.platform)
+                for entity_info in entity_infos
+            },
+            [entity_info_to_snapshot(entity_info) for entity_info in entity_infos],
+        )
+        node_endpoints = self._endpoints.setdefault(endpoint.node.node_id, {})
+        if node_endpoints.get(endpoint.endpoint_id) == snapshot:
+            return
+        node_endpoints[endpoint.endpoint_id] = snapshot
+        self._schedule_save()
+
+    @callback
+    def forget_endpoint(self, node_id: int, endpoint_id: int) -> None:
+        """Remove the discovery results of an endpoint."""
+        if (node_endpoints := self._endpoints.get(node_id)) is None:
+            return
+        if node_endpoints.pop(endpoint_id, None) is not None:
+            self._schedule_save()
+        if not node_endpoints:
+            del self._endpoints[node_id]
+
+    @callback
+    def forget_node(self, node_id: int) -> None:
+        """Remove the discovery results of all endpoints of a node."""
+        if self._endpoints.pop(node_id, None) is not None:
+            self._schedule_save()
+
+    @callback
+    def _schedule_save(self) -> None:
+        """Schedule saving the snapshot to storage."""
+        if self._store is not None:
+            self._store.async_delay_save(self._data_to_save, SNAPSHOT_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        return {
+            "nodes": {
+                str(node_id): {
+                    str(endpoint_id): {
+                        "fingerprint": snapshot.fingerprint,
+                        "signatures": snapshot.signatures,
+                        "entities": snapshot.entities,
+                    }
+                    for endpoint_id, snapshot in endpoints.items()
+                }
+                for node_id, endpoints in self._endpoints.items()
+            },
+        }
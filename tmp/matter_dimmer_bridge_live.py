@@ -4,18 +4,38 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import math
 import time
-from dataclasses import dataclass
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import timedelta
 
 import voluptuous as vol
 from chip.clusters import Objects as clusters
 
 from homeassistant.components.matter.const import DOMAIN as MATTER_DOMAIN
 from homeassistant.components.matter.helpers import get_matter
-from homeassistant.const import CONF_ENTITY_ID, CONF_NAME, EVENT_HOMEASSISTANT_STARTED
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.const import (
+    CONF_ENTITY_ID,
+    CONF_NAME,
+    EVENT_HOMEASSISTANT_STARTED,
+    STATE_UNKNOWN,
+)
+from homeassistant.core import (
+    Event,
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.event import (
+    async_track_state_change_event,
+    async_track_time_interval,
+)
+from homeassistant.util import slugify
 from matter_server.common.helpers.util import create_attribute_path
 from matter_server.common.models import EventType
 
@@ -28,6 +48,8 @@ CONF_TARGETS = "targets"
 CONF_LABEL = "label"
 CONF_DOUBLE_TAP_WINDOW_SECONDS = "double_tap_window_seconds"
 CONF_ENTITY_IDS = "entity_ids"
+CONF_DIRECT_SUBSCRIPTION = "direct_subscription"
+CONF_MEASURE_LATENCY = "measure_latency"
 RETRY_DELAY_SECONDS = 5
 DOUBLE_TAP_WINDOW_SECONDS = 0.45
 TURN_ON_LEVEL_SUPPRESSION_SECONDS = 1.2
@@ -42,6 +64,31 @@ HOLD_CYCLE_HIGH_EDGE = 235
 HOLD_CYCLE_LOW_EDGE = 20
 FOCUS_IDLE_RESET_SECONDS = 30.0
 SWITCH_SYNC_SUPPRESSION_SECONDS = 1.0
+BRIGHTNESS_LATENCY_SAMPLES = 50
+DIMMER_ENDPOINT_ID = 1
+# a Matter level report older than this did not cause the state change
+LEVEL_REPORT_MAX_AGE_SECONDS = 1.0
+LATENCY_SAMPLES = 200
+LATENCY_PUBLISH_INTERVAL = timedelta(seconds=10)
+# a target state report later than this is not attributed to a command
+TARGET_REPORT_TIMEOUT_SECONDS = 5.0
+LATENCY_PERCENTILES = (50, 95, 99)
+# dispatch: inbound dimmer event -> service call dispatched
+# service: service call dispatched -> service call completed
+# target_report: inbound dimmer event -> first state report of a target
+# state_hop: Matter level report -> switch entity state change (state mode)
+LATENCY_STAGES = ("dispatch", "service", "target_report", "state_hop")
+SERVICE_DUMP_DIAGNOSTICS = "dump_diagnostics"
+ONOFF_ATTRIBUTE_PATH = create_attribute_path(
+    DIMMER_ENDPOINT_ID,
+    clusters.OnOff.id,
+    clusters.OnOff.Attributes.OnOff.attribute_id,
+)
+LEVEL_ATTRIBUTE_PATH = create_attribute_path(
+    DIMMER_ENDPOINT_ID,
+    clusters.LevelControl.id,
+    clusters.LevelControl.Attributes.CurrentLevel.attribute_id,
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -68,6 +115,8 @@ BRIDGE_SCHEMA = vol.Schema(
             cv.ensure_list, [TARGET_SCHEMA]
         ),
         vol.Optional(CONF_DOUBLE_TAP_WINDOW_SECONDS): vol.Coerce(float),
+        vol.Optional(CONF_DIRECT_SUBSCRIPTION, default=False): cv.boolean,
+        vol.Optional(CONF_MEASURE_LATENCY, default=False): cv.boolean,
     }
 )
 
@@ -85,6 +134,66 @@ class TargetSpec:
     entity_ids: list[str]
 
 
+def _percentile(sorted_samples: list[float], percent: int) -> float:
+    """Return the (nearest rank) percentile of sorted samples."""
+    rank = math.ceil(percent / 100 * len(sorted_samples))
+    return sorted_samples[max(0, rank - 1)]
+
+
+@dataclass
+class LatencyStats:
+    """Rolling latency samples per stage of the dimmer -> bulb mirroring."""
+
+    samples: dict[str, deque[float]] = field(
+        default_factory=lambda: {
+            stage: deque(maxlen=LATENCY_SAMPLES) for stage in LATENCY_STAGES
+        }
+    )
+    # new samples since the stats were last published
+    dirty: bool = False
+
+    def record(self, stage: str, seconds: float) -> None:
+        """Add a sample to a stage."""
+        self.samples[stage].append(seconds)
+        self.dirty = True
+
+    def as_dict(self) -> dict[str, dict[str, float | int | None]]:
+        """Return count and percentiles (in ms) per stage."""
+        result: dict[str, dict[str, float | int | None]] = {}
+        for stage, samples in self.samples.items():
+            sorted_samples = sorted(samples)
+            result[stage] = {"count": len(sorted_samples)}
+            for percent in LATENCY_PERCENTILES:
+                result[stage][f"p{percent}"] = (
+                    round(_percentile(sorted_samples, percent) * 1000, 1)
+                    if sorted_samples
+                    else None
+                )
+        return result
+
+
+@dataclass
+class BrightnessPipeline:
+    """Latest-wins brightness commands for one target.
+
+    At most one light.turn_on call is in flight, level reports arriving
+    meanwhile only replace the pending brightness (the superseded value
+    is dropped), so a held dimmer can not queue overlapping calls.
+    """
+
+    entity_ids: list[str]
+    in_flight: asyncio.Task | None = None
+    pending_brightness: int | None = None
+    pending_received_at: float = 0.0
+    sent: int = 0
+    dropped: int = 0
+    failed: int = 0
+    # seconds from the level report to the completed light.turn_on call
+    latencies: deque[float] = field(
+        default_factory=lambda: deque(maxlen=BRIGHTNESS_LATENCY_SAMPLES)
+    )
+
+
 @dataclass
 class BridgeState:
     """In-memory state for one mirrored dimmer."""
@@ -113,6 +222,21 @@ class BridgeState:
     target_last_on: dict[str, bool] | None = None
     pending_focus_reset: asyncio.Task | None = None
     ignore_onoff_until: float = 0.0
+    brightness_pipelines: dict[str, BrightnessPipeline] = field(
+        default_factory=dict
+    )
+    # subscribe to the Matter attributes instead of the switch light entity
+    direct_subscription: bool = False
+    # publish the latency sensor and (in state mode) subscribe to the Matter
+    # level reports to measure the state machine hop
+    measure_latency: bool = False
+    last_level_report_at: float | None = None
+    latency: LatencyStats = field(default_factory=LatencyStats)
+    # shadow cache of the target/selector entity states, shared by all
+    # bridges and maintained by the dispatcher from state change events
+    entity_states: dict[str, str | None] = field(default_factory=dict)
+    # target entity_id -> inbound time of the first command not yet reported
+    pending_target_reports: dict[str, float] = field(default_factory=dict)
 
 
 def _matter_to_ha_brightness(level: int | None) -> int:
@@ -123,42 +247,43 @@ def _matter_to_ha_brightness(level: int | None) -> int:
     return round((value - 1) * 255 / 253)
 
 
+def _source_mode(state: BridgeState) -> str:
+    """Return how the dimmer updates are received."""
+    return "direct" if state.direct_subscription else "state"
+
+
 def _target_cycling_enabled(state: BridgeState) -> bool:
     """Return whether target cycling is configured for this dimmer."""
     return bool(state.target_selector and state.targets)
 
 
-def _resolve_selected_target(
-    state: BridgeState, hass: HomeAssistant
-) -> list[str]:
+def _resolve_selected_target(state: BridgeState) -> list[str]:
     """Return the currently selected target entities."""
     if not _target_cycling_enabled(state):
         return state.target_entity_ids
 
-    selector_state = hass.states.get(state.target_selector)
+    selector_state = state.entity_states.get(state.target_selector)
     if selector_state is None:
         return state.targets[-1].entity_ids
 
     for target in state.targets:
-        if target.label == selector_state.state:
+        if target.label == selector_state:
             return target.entity_ids
     return state.targets[-1].entity_ids
 
 
-def _resolve_selected_label(
-    state: BridgeState, hass: HomeAssistant
-) -> str | None:
+def _resolve_selected_label(state: BridgeState) -> str | None:
     """Return the currently selected target label."""
     if not _target_cycling_enabled(state):
         return None
 
-    selector_state = hass.states.get(state.target_selector)
+    selector_state = state.entity_states.get(state.target_selector)
     if selector_state is None:
         return state.targets[-1].label
 
     labels = [target.label for target in state.targets]
-    if selector_state.state in labels:
-        return selector_state.state
+    if selector_state in labels:
+        return selector_state
     return state.targets[-1].label
 
 
@@ -172,17 +297,23 @@ def _resolve_default_target(
     return default.label, default.entity_ids
 
 
+def _available_target_states(
+    state: BridgeState, entity_ids: list[str]
+) -> list[str]:
+    """Return the (cached) states of the available target entities."""
+    return [
+        entity_state
+        for entity_id in entity_ids
+        if (entity_state := state.entity_states.get(entity_id)) is not None
+        and entity_state not in ("unknown", "unavailable")
+    ]
+
+
 def _uniform_target_state(
-    hass: HomeAssistant, entity_ids: list[str]
+    state: BridgeState, entity_ids: list[str]
 ) -> bool | None:
     """Return True/False if all target entities share one state."""
-    states = [hass.states.get(entity_id) for entity_id in entity_ids]
-    available = [
-        entity_state.state
-        for entity_state in states
-        if entity_state is not None
-        and entity_state.state not in ("unknown", "unavailable")
-    ]
+    available = _available_target_states(state, entity_ids)
     if len(available) != len(entity_ids) or not available:
         return None
     if all(value == "on" for value in available):
@@ -229,7 +360,7 @@ def _schedule_focus_reset(hass: HomeAssistant, state: BridgeState) -> None:
     async def _reset_focus_later() -> None:
         try:
             await asyncio.sleep(FOCUS_IDLE_RESET_SECONDS)
-            current_label = _resolve_selected_label(state, hass)
+            current_label = _resolve_selected_label(state)
             default_label, default_entities = _resolve_default_target(state)
             if current_label != default_label and default_label is not None:
                 await hass.services.async_call(
@@ -246,7 +377,7 @@ def _schedule_focus_reset(hass: HomeAssistant, state: BridgeState) -> None:
                     state.name,
                     default_label,
                 )
-            uniform_state = _uniform_target_state(hass, default_entities)
+            uniform_state = _uniform_target_state(state, default_entities)
             if uniform_state is not None:
                 await _async_drive_switch_indicator(
                     hass, state, turn_on=uniform_state
@@ -265,7 +396,7 @@ async def _async_cycle_target(hass: HomeAssistant, state: BridgeState) -> None:
         return
 
     labels = [target.label for target in state.targets]
-    current_label = _resolve_selected_label(state, hass) or labels[-1]
+    current_label = _resolve_selected_label(state) or labels[-1]
     LOGGER.info(
         "%s selected target before press: %s",
         state.name,
@@ -382,12 +513,52 @@ async def _async_flash_target_entities(
     )
 
 
+def _all_target_entity_ids(state: BridgeState) -> set[str]:
+    """Return the entity ids of all (selectable) targets."""
+    entity_ids = set(state.target_entity_ids)
+    for target in state.targets or ():
+        entity_ids.update(target.entity_ids)
+    return entity_ids
+
+
+async def _async_call_light(
+    hass: HomeAssistant,
+    state: BridgeState,
+    service: str,
+    service_data: dict[str, object],
+    received_at: float | None,
+) -> None:
+    """Call a light service for the targets, recording the latencies.
+
+    received_at is when the dimmer event causing the call was received.
+    """
+    dispatched_at = time.monotonic()
+    if received_at is not None:
+        state.latency.record("dispatch", dispatched_at - received_at)
+        for entity_id in service_data["entity_id"]:
+            reported = state.pending_target_reports.get(entity_id)
+            if (
+                reported is None
+                or dispatched_at - reported > TARGET_REPORT_TIMEOUT_SECONDS
+            ):
+                state.pending_target_reports[entity_id] = received_at
+    await hass.services.async_call(
+        "light", service, service_data, blocking=True
+    )
+    state.latency.record("service", time.monotonic() - dispatched_at)
+
+
 async def _async_turn_on(
-    hass: HomeAssistant, state: BridgeState, *, brightness: int | None = None
+    hass: HomeAssistant,
+    state: BridgeState,
+    *,
+    brightness: int | None = None,
+    entity_ids: list[str] | None = None,
+    received_at: float | None = None,
 ) -> None:
     """Mirror dimmer on/brightness to target bulbs."""
-    entity_id = (
-        _resolve_selected_target(state, hass)
+    entity_id = entity_ids or (
+        _resolve_selected_target(state)
         if _target_cycling_enabled(state)
         else state.target_entity_ids
     )
@@ -396,67 +567,148 @@ async def _async_turn_on(
     service_data["transition"] = DEFAULT_TRANSITION_SECONDS
     if brightness is not None:
         service_data["brightness"] = max(1, min(255, brightness))
-    await hass.services.async_call(
-        "light", "turn_on", service_data, blocking=True
-    )
+    await _async_call_light(hass, state, "turn_on", service_data, received_at)
     if _target_cycling_enabled(state):
         state.target_last_on = state.target_last_on or {}
         state.target_last_on["|".join(entity_id)] = True
 
 
-async def _async_turn_off(hass: HomeAssistant, state: BridgeState) -> None:
+def _queue_brightness(
+    hass: HomeAssistant,
+    state: BridgeState,
+    brightness: int,
+    received_at: float | None = None,
+) -> None:
+    """Queue a brightness for the selected target, replacing a pending one.
+
+    received_at is when the level was reported, for the latency counters.
+    """
+    entity_ids = (
+        _resolve_selected_target(state)
+        if _target_cycling_enabled(state)
+        else state.target_entity_ids
+    )
+    key = "|".join(entity_ids)
+    pipeline = state.brightness_pipelines.get(key)
+    if pipeline is None:
+        pipeline = state.brightness_pipelines[key] = BrightnessPipeline(
+            list(entity_ids)
+        )
+    if pipeline.pending_brightness is not None:
+        pipeline.dropped += 1
+        LOGGER.debug(
+            "%s dropping superseded brightness %s -> %s",
+            state.name,
+            pipeline.pending_brightness,
+            brightness,
+        )
+    pipeline.pending_brightness = brightness
+    pipeline.pending_received_at = received_at or time.monotonic()
+    if pipeline.in_flight is None:
+        pipeline.in_flight = hass.async_create_task(
+            _async_run_brightness_pipeline(hass, state, pipeline)
+        )
+
+
+def _discard_pending_brightness(state: BridgeState) -> None:
+    """Drop the pending brightness of all targets (e.g. on turn off)."""
+    for pipeline in state.brightness_pipelines.values():
+        if pipeline.pending_brightness is not None:
+            pipeline.pending_brightness = None
+            pipeline.dropped += 1
+
+
+async def _async_run_brightness_pipeline(
+    hass: HomeAssistant, state: BridgeState, pipeline: BrightnessPipeline
+) -> None:
+    """Send the latest pending brightness until there is none left."""
+    try:
+        while (brightness := pipeline.pending_brightness) is not None:
+            received_at = pipeline.pending_received_at
+            pipeline.pending_brightness = None
+            try:
+                await _async_turn_on(
+                    hass,
+                    state,
+                    brightness=brightness,
+                    entity_ids=pipeline.entity_ids,
+                    received_at=received_at,
+                )
+            except Exception:
+                pipeline.failed += 1
+                LOGGER.exception("%s failed to set brightness", state.name)
+                continue
+            pipeline.sent += 1
+            pipeline.latencies.append(time.monotonic() - received_at)
+    finally:
+        pipeline.in_flight = None
+    LOGGER.debug(
+        "%s brightness pipeline %s (%s mode): sent %s, dropped %s, failed %s,"
+        " last latency %.0f ms",
+        state.name,
+        pipeline.entity_ids,
+        _source_mode(state),
+        pipeline.sent,
+        pipeline.dropped,
+        pipeline.failed,
+        pipeline.latencies[-1] * 1000 if pipeline.latencies else 0.0,
+    )
+
+
+async def _async_turn_off(
+    hass: HomeAssistant, state: BridgeState, received_at: float | None = None
+) -> None:
     """Mirror dimmer off to target bulbs."""
+    # a brightness sent after the turn off would turn the target back on
+    _discard_pending_brightness(state)
     entity_id = (
-        _resolve_selected_target(state, hass)
+        _resolve_selected_target(state)
         if _target_cycling_enabled(state)
         else state.target_entity_ids
     )
     LOGGER.info("%s entity IDs toggled: %s", state.name, entity_id)
-    await hass.services.async_call(
-        "light",
+    await _async_call_light(
+        hass,
+        state,
         "turn_off",
         {
             "entity_id": entity_id,
             "transition": DEFAULT_TRANSITION_SECONDS,
         },
-        blocking=True,
+        received_at,
     )
     if _target_cycling_enabled(state):
         state.target_last_on = state.target_last_on or {}
         state.target_last_on["|".join(entity_id)] = False
 
 
-async def _async_toggle_selected(hass: HomeAssistant, state: BridgeState) -> None:
+async def _async_toggle_selected(
+    hass: HomeAssistant, state: BridgeState, received_at: float | None = None
+) -> None:
     """Toggle the currently selected target."""
-    selected_label = _resolve_selected_label(state, hass)
-    entity_ids = _resolve_selected_target(state, hass)
+    selected_label = _resolve_selected_label(state)
+    entity_ids = _resolve_selected_target(state)
     if selected_label is not None:
         LOGGER.info(
             "%s selected target before press: %s",
             state.name,
             selected_label,
         )
-    states = [hass.states.get(entity_id) for entity_id in entity_ids]
-    available_states = [
-        entity_state.state
-        for entity_state in states
-        if entity_state is not None
-        and entity_state.state not in ("unknown", "unavailable")
-    ]
+    available_states = _available_target_states(state, entity_ids)
     if available_states:
         any_on = any(state_value == "on" for state_value in available_states)
     else:
         state.target_last_on = state.target_last_on or {}
         any_on = state.target_last_on.get("|".join(entity_ids), False)
     if any_on:
-        await _async_turn_off(hass, state)
+        await _async_turn_off(hass, state, received_at)
         _schedule_focus_reset(hass, state)
         return
 
     state.suppress_level_until = (
         time.monotonic() + TURN_ON_LEVEL_SUPPRESSION_SECONDS
     )
-    await _async_turn_on(hass, state)
+    await _async_turn_on(hass, state, received_at=received_at)
     _schedule_focus_reset(hass, state)
 
 
@@ -464,7 +716,7 @@ def _load_initial_state(hass: HomeAssistant, state: BridgeState) -> None:
     """Prime cached switch state from Matter node data."""
     matter = get_matter(hass)
     node = matter.matter_client.get_node(state.node_id)
-    endpoint = node.endpoints[1]
+    endpoint = node.endpoints[DIMMER_ENDPOINT_ID]
     onoff_cluster = endpoint.get_cluster(clusters.OnOff)
     level_cluster = endpoint.get_cluster(clusters.LevelControl)
     if onoff_cluster is not None:
@@ -476,9 +728,196 @@ def _load_initial_state(hass: HomeAssistant, state: BridgeState) -> None:
             state.last_level_value = int(level)
 
 
-def _setup_bridge(hass: HomeAssistant, state: BridgeState) -> list[callable]:
-    """Subscribe to switch entity state updates for one dimmer."""
-    _load_initial_state(hass, state)
+def _latency_sensor_entity_id(state: BridgeState) -> str:
+    """Return the entity id of the latency sensor of a dimmer."""
+    return f"sensor.{slugify(state.name)}_dimmer_latency"
+
+
+def _bridge_diagnostics(state: BridgeState) -> dict[str, object]:
+    """Return the diagnostics of one dimmer bridge."""
+    return {
+        "node_id": state.node_id,
+        "mode": _source_mode(state),
+        "latency_ms": state.latency.as_dict(),
+        "brightness_pipelines": {
+            key: {
+                "sent": pipeline.sent,
+                "dropped": pipeline.dropped,
+                "failed": pipeline.failed,
+                "in_flight": pipeline.in_flight is not None,
+            }
+            for key, pipeline in state.brightness_pipelines.items()
+        },
+        "pending_target_reports": len(state.pending_target_reports),
+    }
+
+
+@dataclass
+class BridgeHandlers:
+    """Event handlers of one dimmer bridge, called by the dispatcher."""
+
+    state: BridgeState
+    state_updated: Callable[[Event], None]
+    target_updated: Callable[[Event], None]
+    matter_onoff_reported: Callable[[EventType, tuple[int, str, object]], None]
+    matter_level_reported: Callable[[EventType, tuple[int, str, object]], None]
+    publish_latency: Callable[[], None]
+
+
+class BridgeDispatcher:
+    """Route the events of all dimmer bridges from a single set of listeners.
+
+    One state change listener covers the switch, target and selector entities
+    of all dimmers and one set of Matter subscriptions all dimmer nodes,
+    each event is routed to its bridge(s) with a dict lookup.
+    The state change events also maintain the shadow cache of entity states.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the dispatcher."""
+        self.hass = hass
+        self.entity_states: dict[str, str | None] = {}
+        self._bridges: list[BridgeHandlers] = []
+        # a switch, target or dimmer node may be shared by several bridges
+        self._by_switch: dict[str, list[BridgeHandlers]] = {}
+        self._by_target: dict[str, list[BridgeHandlers]] = {}
+        # (node_id, attribute path) -> handlers
+        self._by_attribute: dict[
+            tuple[int, str], list[Callable[[EventType, tuple[int, str, object]], None]]
+        ] = {}
+        self._subscribed_matter: object | None = None
+        self._matter_unsubs: list[Callable[[], None]] = []
+
+    def add_bridge(self, handlers: BridgeHandlers) -> None:
+        """Add the handlers of a dimmer bridge to the indexes."""
+        state = handlers.state
+        state.entity_states = self.entity_states
+        self._bridges.append(handlers)
+        if not state.direct_subscription:
+            self._by_switch.setdefault(state.switch_entity_id, []).append(handlers)
+        for entity_id in _all_target_entity_ids(state):
+            self._by_target.setdefault(entity_id, []).append(handlers)
+        if state.target_selector:
+            self.entity_states.setdefault(state.target_selector, None)
+        if state.direct_subscription or state.measure_latency:
+            self._by_attribute.setdefault(
+                (state.node_id, LEVEL_ATTRIBUTE_PATH), []
+            ).append(handlers.matter_level_reported)
+        if state.direct_subscription:
+            self._by_attribute.setdefault(
+                (state.node_id, ONOFF_ATTRIBUTE_PATH), []
+            ).append(handlers.matter_onoff_reported)
+
+    @callback
+    def async_start(self) -> list[Callable[[], None]]:
+        """Prime the shadow cache and start listening, return the unsubscribes."""
+        tracked = {*self.entity_states, *self._by_switch, *self._by_target}
+        for entity_id in tracked:
+            entity_state = self.hass.states.get(entity_id)
+            self.entity_states[entity_id] = (
+                entity_state.state if entity_state is not None else None
+            )
+        unsubs = [
+            async_track_state_change_event(
+                self.hass, sorted(tracked), self._async_state_changed
+            )
+        ]
+        if self._by_attribute:
+            self._async_subscribe_matter()
+            unsubs.append(self._async_unsubscribe_matter)
+            # resubscribe as soon as Matter was reloaded
+            unsubs.extend(
+                entry.async_on_state_change(self._async_subscribe_matter)
+                for entry in self.hass.config_entries.async_entries(MATTER_DOMAIN)
+            )
+        if any(handlers.state.measure_latency for handlers in self._bridges):
+            unsubs.append(
+                async_track_time_interval(
+                    self.hass, self._async_publish_latency, LATENCY_PUBLISH_INTERVAL
+                )
+            )
+        return unsubs
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Update the shadow cache and route a state change."""
+        entity_id = event.data["entity_id"]
+        new_state = event.data.get("new_state")
+        self.entity_states[entity_id] = (
+            new_state.state if new_state is not None else None
+        )
+        for switch_handlers in self._by_switch.get(entity_id, ()):
+            switch_handlers.state_updated(event)
+        for target_handlers in self._by_target.get(entity_id, ()):
+            target_handlers.target_updated(event)
+
+    @callback
+    def _async_matter_attribute_updated(
+        self, event: EventType, data: tuple[int, str, object]
+    ) -> None:
+        """Route a Matter attribute report to its bridge(s)."""
+        for handler in self._by_attribute.get((data[0], data[1]), ()):
+            handler(event, data)
+
+    @callback
+    def _async_subscribe_matter(self) -> None:
+        """(Re)subscribe to the dimmer attributes when Matter was set up again.
+
+        Uses the event router of the Matter adapter if it has one
+        (it survives a reconnect to the server), else a single
+        subscription to all attribute updates of the client.
+        """
+        try:
+            matter = get_matter(self.hass)
+        except (KeyError, StopIteration):
+            # Matter is being (re)loaded
+            self._async_unsubscribe_matter()
+            return
+        subscribe = getattr(matter, "subscribe_attribute_events", None)
+        source = matter if subscribe is not None else matter.matter_client
+        if source is self._subscribed_matter:
+            return
+        self._async_unsubscribe_matter()
+        if subscribe is not None:
+            self._matter_unsubs = [
+                subscribe(self._async_matter_attribute_updated, node_id, path)
+                for node_id, path in self._by_attribute
+            ]
+        else:
+            self._matter_unsubs = [
+                matter.matter_client.subscribe_events(
+                    callback=self._async_matter_attribute_updated,
+                    event_filter=EventType.ATTRIBUTE_UPDATED,
+                )
+            ]
+        self._subscribed_matter = source
+
+    @callback
+    def _async_unsubscribe_matter(self) -> None:
+        """Remove the Matter subscriptions."""
+        for unsub in self._matter_unsubs:
+            unsub()
+        self._matter_unsubs = []
+        self._subscribed_matter = None
+
+    @callback
+    def _async_publish_latency(self, _: object = None) -> None:
+        """Publish the latency sensors of all bridges."""
+        for handlers in self._bridges:
+            if handlers.state.measure_latency:
+                handlers.publish_latency()
+
+
+def _setup_bridge(hass: HomeAssistant, state: BridgeState) -> BridgeHandlers:
+    """Return the handlers of the dimmer updates, for the dispatcher.
+
+    In direct subscription mode the OnOff and LevelControl attribute reports
+    of the dimmer node are handled without the HA state machine hop.
+    In (default) state mode the level reports are only used to measure
+    the latency of that hop.
+    The handlers only use the hass services, states and task creation,
+    so they can be driven by a stand-in (see matter_dimmer_gesture_replay).
+    """
 
     @callback
     def onoff_updated(event: EventType, value: object) -> None:
@@ -524,7 +963,8 @@ def _setup_bridge(hass: HomeAssistant, state: BridgeState) -> list[callable]:
             async def _delayed_single_tap() -> None:
                 try:
                     await asyncio.sleep(state.double_tap_window_seconds)
-                    await _async_toggle_selected(hass, state)
+                    # the double tap window is part of the measured latency
+                    await _async_toggle_selected(hass, state, now)
                     state.last_single_tap_completed_at = time.monotonic()
                 except asyncio.CancelledError:
                     raise
@@ -542,12 +982,16 @@ def _setup_bridge(hass: HomeAssistant, state: BridgeState) -> list[callable]:
             state.suppress_level_until = (
                 time.monotonic() + TURN_ON_LEVEL_SUPPRESSION_SECONDS
             )
-            hass.async_create_task(_async_turn_on(hass, state))
+            hass.async_create_task(
+                _async_turn_on(hass, state, received_at=now)
+            )
         else:
-            hass.async_create_task(_async_turn_off(hass, state))
+            hass.async_create_task(_async_turn_off(hass, state, now))
 
     @callback
-    def level_updated(event: EventType, value: object) -> None:
+    def level_updated(
+        event: EventType, value: object, received_at: float | None = None
+    ) -> None:
         if not isinstance(value, int):
             return
         now = time.monotonic()
@@ -623,9 +1067,7 @@ def _setup_bridge(hass: HomeAssistant, state: BridgeState) -> list[callable]:
                 hass.async_create_task(_async_cycle_target(hass, state))
                 return
         if state.is_on is not False:
-            hass.async_create_task(
-                _async_turn_on(hass, state, brightness=state.brightness)
-            )
+            _queue_brightness(hass, state, state.brightness, received_at)
             if _target_cycling_enabled(state):
                 _schedule_focus_reset(hass, state)
 
@@ -659,15 +1101,81 @@ def _setup_bridge(hass: HomeAssistant, state: BridgeState) -> list[callable]:
                     round((int(new_brightness) * 253 / 255) + 1),
                 ),
             )
-            level_updated(EventType.ATTRIBUTE_UPDATED, matter_level)
+            received_at: float | None = None
+            reported_at = state.last_level_report_at
+            if (
+                reported_at is not None
+                and time.monotonic() - reported_at < LEVEL_REPORT_MAX_AGE_SECONDS
+            ):
+                received_at = reported_at
+                state.last_level_report_at = None
+                state_hop = time.monotonic() - reported_at
+                state.latency.record("state_hop", state_hop)
+                LOGGER.debug(
+                    "%s state machine hop took %.0f ms",
+                    state.name,
+                    state_hop * 1000,
+                )
+            level_updated(EventType.ATTRIBUTE_UPDATED, matter_level, received_at)
 
-    return [
-        async_track_state_change_event(
-            hass,
-            [state.switch_entity_id],
-            state_updated,
+    @callback
+    def matter_onoff_reported(
+        event: EventType, data: tuple[int, str, object]
+    ) -> None:
+        onoff_updated(event, data[2])
+
+    @callback
+    def matter_level_reported(
+        event: EventType, data: tuple[int, str, object]
+    ) -> None:
+        if state.direct_subscription:
+            level_updated(event, data[2], time.monotonic())
+        else:
+            state.last_level_report_at = time.monotonic()
+
+    @callback
+    def target_updated(event: Event) -> None:
+        """Record the latency of the first state report of a target."""
+        entity_id = event.data["entity_id"]
+        if (received_at := state.pending_target_reports.pop(entity_id, None)) is None:
+            return
+        latency = time.monotonic() - received_at
+        if latency <= TARGET_REPORT_TIMEOUT_SECONDS:
+            state.latency.record("target_report", latency)
+
+    @callback
+    def publish_latency() -> None:
+        """Publish the latency percentiles as a sensor, if there are new samples."""
+        if not state.latency.dirty:
+            return
+        state.latency.dirty = False
+        stats = state.latency.as_dict()
+        # the other stages can have samples before the first target report
+        if (target_report_p95 := stats["target_report"]["p95"]) is None:
+            target_report_p95 = STATE_UNKNOWN
+        hass.states.async_set(
+            _latency_sensor_entity_id(state),
+            target_report_p95,
+            {
+                "friendly_name": f"{state.name} dimmer latency",
+                "unit_of_measurement": "ms",
+                "mode": _source_mode(state),
+                **{
+                    f"{stage}_{key}": value
+                    for stage, stage_stats in stats.items()
+                    for key, value in stage_stats.items()
+                },
+            },
         )
-    ]
+
+    return BridgeHandlers(
+        state=state,
+        state_updated=state_updated,
+        target_updated=target_updated,
+        matter_onoff_reported=matter_onoff_reported,
+        matter_level_reported=matter_level_reported,
+        publish_latency=publish_latency,
+    )
 
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
@@ -704,9 +1212,23 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
                     DOUBLE_TAP_WINDOW_SECONDS,
                 )
             ),
+            direct_subscription=entry[CONF_DIRECT_SUBSCRIPTION],
+            measure_latency=entry[CONF_MEASURE_LATENCY],
         )
         for entry in entries
     ]
+    domain_data["states"] = states
+
+    async def _async_dump_diagnostics(call: ServiceCall) -> ServiceResponse:
+        """Return the latency histograms and counters of all dimmers."""
+        return {state.name: _bridge_diagnostics(state) for state in states}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_DUMP_DIAGNOSTICS,
+        _async_dump_diagnostics,
+        supports_response=SupportsResponse.ONLY,
+    )
 
     async def _async_start(_: Event | None = None) -> None:
         if domain_data["started"]:
@@ -721,14 +1243,18 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
             )
             return
         try:
-            unsubs: list[callable] = []
+            dispatcher = BridgeDispatcher(hass)
             for state in states:
-                unsubs.extend(_setup_bridge(hass, state))
-            domain_data["unsubs"] = unsubs
+                _load_initial_state(hass, state)
+                dispatcher.add_bridge(_setup_bridge(hass, state))
+            domain_data["unsubs"] = dispatcher.async_start()
+            domain_data["dispatcher"] = dispatcher
             domain_data["started"] = True
             LOGGER.info(
                 "Started Matter dimmer bridge for %s",
-                ", ".join(state.name for state in states),
+                ", ".join(
+                    f"{state.name} ({_source_mode(state)})" for state in states
+                ),
             )
         except Exception:
             LOGGER.exception("Failed to start Matter dimmer bridge")
@@ -0,0 +1,579 @@
+#!/usr/bin/env python3
+"""Replay dimmer gestures against matter_dimmer_bridge_live on a virtual clock.
+
+The OnOff and LevelControl reports of a gesture are fed into the bridge
+handlers (in direct subscription mode) on an event loop with a virtual
+clock, so the double tap, debounce and hold windows are exercised
+deterministically and without waiting for them. The resulting service
+calls are recorded. A gesture passes if it calls its expected service
+and, besides the focus flash of a newly selected target, only the other
+services it allows (e.g. the brightness updates while a dimmer is held).
+The latency of the first expected call (from the decisive report of the
+gesture, by default the first one) is reported for every combination
+of the tuned window values.
+
+Recorded timelines use the event stream format of matter_fabric_replay:
+
+    {"timestamp": 0.125, "event": "attribute_updated", "data": [5, "1/6/0", true]}
+
+Usage:
+
+    python matter_dimmer_gesture_replay.py [--events STREAM.jsonl ...] \
+        [--node-id 5] [--double-tap-window 0.3 0.35 0.45] \
+        [--debounce 0.1 0.15] [--hold-window 1.5 2.0] [--hold-min-updates 3]
+
+Run from the directory containing matter_dimmer_bridge_live.py.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+from collections.abc import Coroutine, Iterable, Iterator
+from contextlib import contextmanager
+import contextvars
+from dataclasses import dataclass, field
+import itertools
+import json
+from pathlib import Path
+import selectors
+import statistics
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from matter_server.common.models import EventType
+
+import matter_dimmer_bridge_live as bridge
+
+REPLAY_NODE_ID = 1
+SWITCH_ENTITY_ID = "light.replay_dimmer"
+TARGET_SELECTOR = "input_select.replay_dimmer_target"
+REPLAY_TARGETS = (
+    bridge.TargetSpec("Ceiling", ["light.replay_ceiling"]),
+    bridge.TargetSpec("Lamp", ["light.replay_lamp"]),
+)
+# virtual seconds after the last report for pending decisions to complete,
+# well below the focus idle reset
+SETTLE_SECONDS = 3.0
+# virtual duration of a service call
+SERVICE_LATENCY_SECONDS = 0.05
+ONOFF = bridge.ONOFF_ATTRIBUTE_PATH
+LEVEL = bridge.LEVEL_ATTRIBUTE_PATH
+SELECT_OPTION = "input_select.select_option"
+TURN_ON = "light.turn_on"
+# set in the tasks flashing the newly selected target
+_FLASHING: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "flashing", default=False
+)
+
+
+class VirtualClock:
+    """Monotonic clock which only advances when the event loop would sleep."""
+
+    def __init__(self) -> None:
+        """Initialize the clock."""
+        self.now = 0.0
+
+    def time(self) -> float:
+        """Return the current virtual time."""
+        return self.now
+
+
+class _VirtualSelector(selectors.DefaultSelector):
+    """Selector which advances the virtual clock instead of blocking."""
+
+    def __init__(self, clock: VirtualClock) -> None:
+        """Initialize the selector."""
+        super().__init__()
+        self._clock = clock
+
+    def select(self, timeout: float | None = None) -> list[Any]:
+        """Poll without blocking, jump to the next timer if nothing is ready."""
+        events = super().select(0)
+        if not events and timeout is None:
+            raise RuntimeError("Replay stalled: no timers or ready callbacks left")
+        if not events and timeout:
+            self._clock.now += timeout
+        return events
+
+
+class VirtualClockEventLoop(asyncio.SelectorEventLoop):
+    """Event loop running on a virtual clock."""
+
+    def __init__(self, clock: VirtualClock) -> None:
+        """Initialize the event loop."""
+        super().__init__(_VirtualSelector(clock))
+        self._clock = clock
+
+    def time(self) -> float:
+        """Return the virtual time."""
+        return self._clock.now
+
+
+@dataclass
+class Gesture:
+    """Timeline of dimmer reports: (seconds, attribute path, value)."""
+
+    name: str
+    reports: tuple[tuple[float, str, object], ...]
+    # service expected to be the decision of the gesture, None to only record
+    expected: str | None = None
+    # other services the gesture may call (besides the focus flash)
+    allowed: tuple[str, ...] = ()
+    # report from which the decision latency is measured,
+    # None for the last report before the decision
+    decisive_report: int | None = 0
+
+
+def _level_ramp(
+    start: int, step: int, count: int, interval: float
+) -> tuple[tuple[float, str, object], ...]:
+    """Return level reports of a dimmer being held."""
+    return tuple(
+        (index * interval, LEVEL, start + index * step) for index in range(count)
+    )
+
+
+SYNTHETIC_GESTURES = (
+    Gesture("single tap", ((0.0, ONOFF, True),), TURN_ON),
+    Gesture(
+        "double tap",
+        ((0.0, ONOFF, True), (0.15, ONOFF, False), (0.35, ONOFF, True)),
+        SELECT_OPTION,
+        decisive_report=2,
+    ),
+    Gesture(
+        "fast double tap",
+        ((0.0, ONOFF, True), (0.08, ONOFF, False), (0.25, ONOFF, True)),
+        SELECT_OPTION,
+        decisive_report=2,
+    ),
+    Gesture(
+        "contact bounce",
+        ((0.0, ONOFF, True), (0.04, ONOFF, False), (0.07, ONOFF, True)),
+        TURN_ON,
+    ),
+    # the brightness follows the dimmer until the hold reaches the edge
+    Gesture("hold up", _level_ramp(100, 30, 6, 0.2), SELECT_OPTION, (TURN_ON,)),
+    Gesture("hold down", _level_ramp(160, -30, 6, 0.2), SELECT_OPTION, (TURN_ON,)),
+    Gesture("slow dim", _level_ramp(100, 30, 6, 0.6), TURN_ON),
+)
+
+
+@dataclass(frozen=True)
+class ReplaySettings:
+    """Window values used for a replay."""
+
+    double_tap_window: float
+    debounce: float
+    hold_window: float
+    hold_min_updates: int
+
+    def __str__(self) -> str:
+        """Return the settings in a readable form."""
+        return (
+            f"double tap window {self.double_tap_window} s,"
+            f" debounce {self.debounce} s, hold window {self.hold_window} s,"
+            f" hold min updates {self.hold_min_updates}"
+        )
+
+
+# the window values the bridge ships with
+DEFAULT_SETTINGS = ReplaySettings(
+    double_tap_window=bridge.DOUBLE_TAP_WINDOW_SECONDS,
+    debounce=bridge.ONOFF_DEBOUNCE_SECONDS,
+    hold_window=bridge.HOLD_CYCLE_WINDOW_SECONDS,
+    hold_min_updates=bridge.HOLD_CYCLE_MIN_UPDATES,
+)
+
+
+@dataclass(slots=True)
+class ReplayServiceCall:
+    """A service call made by the bridge."""
+
+    at: float
+    service: str
+    service_data: dict[str, Any]
+    # part of the focus flash of a newly selected target
+    flash: bool = False
+
+
+@dataclass
+class GestureResult:
+    """Outcome of replaying a gesture."""
+
+    gesture: Gesture
+    calls: list[ReplayServiceCall]
+    # wall clock seconds spent in the bridge handlers per report
+    handler_times: list[float]
+
+    @property
+    def decision(self) -> ReplayServiceCall | None:
+        """Return the first call of the expected service.
+
+        Without an expected service, the first call which is not part of
+        the focus flash.
+        """
+        return next(
+            (
+                call
+                for call in self.calls
+                if not call.flash
+                and self.gesture.expected in (None, call.service)
+            ),
+            None,
+        )
+
+    @property
+    def decision_latency(self) -> float | None:
+        """Return the seconds from the decisive report to the decision."""
+        if (decision := self.decision) is None:
+            return None
+        reports = self.gesture.reports
+        if (index := self.gesture.decisive_report) is not None:
+            return decision.at - reports[index][0]
+        return decision.at - max(
+            offset for offset, _, _ in reports if offset <= decision.at
+        )
+
+    @property
+    def passed(self) -> bool | None:
+        """Return if the expected decision was made, None if nothing expected."""
+        if self.gesture.expected is None:
+            return None
+        if self.decision is None:
+            return False
+        permitted = {self.gesture.expected, *self.gesture.allowed}
+        return all(
+            call.service in permitted for call in self.calls if not call.flash
+        )
+
+
+@dataclass
+class ReplayState:
+    """Minimal entity state, as read by the bridge."""
+
+    state: str
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+
+class ReplayStates:
+    """Local stand-in for the state machine."""
+
+    def __init__(self) -> None:
+        """Initialize the states."""
+        self._states: dict[str, ReplayState] = {}
+
+    def get(self, entity_id: str) -> ReplayState | None:
+        """Return the state of an entity."""
+        return self._states.get(entity_id)
+
+    def async_set(
+        self,
+        entity_id: str,
+        new_state: Any,
+        attributes: dict[str, Any] | None = None,
+    ) -> None:
+        """Set the state of an entity."""
+        self._states[entity_id] = ReplayState(str(new_state), attributes or {})
+
+
+class ReplayServices:
+    """Local stand-in for the service registry, recording the calls.
+
+    The light and input_select services take the (virtual) service latency
+    and then update the states like the real integrations would.
+    """
+
+    def __init__(self, hass: ReplayHass) -> None:
+        """Initialize the services."""
+        self._hass = hass
+        self.calls: list[ReplayServiceCall] = []
+
+    async def async_call(
+        self,
+        domain: str,
+        service: str,
+        service_data: dict[str, Any] | None = None,
+        blocking: bool = False,
+    ) -> None:
+        """Record a service call and apply its effect."""
+        service_data = service_data or {}
+        self.calls.append(
+            ReplayServiceCall(
+                self._hass.clock.now,
+                f"{domain}.{service}",
+                service_data,
+                _FLASHING.get(),
+            )
+        )
+        await asyncio.sleep(self._hass.service_latency)
+        entity_ids = service_data.get("entity_id", [])
+        if isinstance(entity_ids, str):
+            entity_ids = [entity_ids]
+        if domain == "light" and service in ("turn_on", "turn_off"):
+            for entity_id in entity_ids:
+                self._hass.set_state(entity_id, service.removeprefix("turn_"))
+        elif domain == "input_select" and service == "select_option":
+            for entity_id in entity_ids:
+                self._hass.set_state(entity_id, service_data["option"])
+
+
+class ReplayHass:
+    """Local stand-in for the part of HomeAssistant used by the bridge handlers."""
+
+    def __init__(self, clock: VirtualClock, service_latency: float) -> None:
+        """Initialize the stand-in."""
+        self.clock = clock
+        self.service_latency = service_latency
+        self.states = ReplayStates()
+        self.services = ReplayServices(self)
+        # the shadow cache of the bridge, maintained by the dispatcher in HA
+        self.entity_states: dict[str, str | None] = {}
+        self.tasks: set[asyncio.Task] = set()
+
+    def set_state(self, entity_id: str, new_state: str) -> None:
+        """Set an entity state and its cached value."""
+        self.states.async_set(entity_id, new_state)
+        self.entity_states[entity_id] = new_state
+
+    def async_create_task(
+        self, target: Coroutine[Any, Any, Any], name: str | None = None
+    ) -> asyncio.Task:
+        """Create a tracked task, flagging the calls of the focus flash."""
+        context = contextvars.copy_context()
+        if target.__name__ == bridge._async_flash_target_entities.__name__:
+            context.run(_FLASHING.set, True)
+        task = asyncio.get_running_loop().create_task(
+            target, name=name, context=context
+        )
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return task
+
+
+@contextmanager
+def replay_environment(
+    clock: VirtualClock, settings: ReplaySettings
+) -> Iterator[None]:
+    """Run the bridge on the virtual clock with the given module constants."""
+    overrides = {
+        "time": SimpleNamespace(monotonic=clock.time),
+        "ONOFF_DEBOUNCE_SECONDS": settings.debounce,
+        "HOLD_CYCLE_WINDOW_SECONDS": settings.hold_window,
+        "HOLD_CYCLE_MIN_UPDATES": settings.hold_min_updates,
+    }
+    originals = {name: getattr(bridge, name) for name in overrides}
+    for name, value in overrides.items():
+        setattr(bridge, name, value)
+    try:
+        yield
+    finally:
+        for name, value in originals.items():
+            setattr(bridge, name, value)
+
+
+async def _async_replay(
+    hass: ReplayHass, settings: ReplaySettings, gesture: Gesture
+) -> GestureResult:
+    """Feed the reports of a gesture into a fresh bridge, return the outcome."""
+    state = bridge.BridgeState(
+        name="replay",
+        node_id=REPLAY_NODE_ID,
+        switch_entity_id=SWITCH_ENTITY_ID,
+        target_entity_ids=[],
+        target_selector=TARGET_SELECTOR,
+        targets=list(REPLAY_TARGETS),
+        double_tap_window_seconds=settings.double_tap_window,
+        direct_subscription=True,
+        entity_states=hass.entity_states,
+    )
+    hass.set_state(SWITCH_ENTITY_ID, "off")
+    hass.set_state(TARGET_SELECTOR, REPLAY_TARGETS[0].label)
+    for entity_id in bridge._all_target_entity_ids(state):
+        hass.set_state(entity_id, "off")
+    handlers = bridge._setup_bridge(hass, state)
+    route = {
+        ONOFF: handlers.matter_onoff_reported,
+        LEVEL: handlers.matter_level_reported,
+    }
+    handler_times: list[float] = []
+
+    def report(path: str, value: object) -> None:
+        start = time.perf_counter()
+        route[path](EventType.ATTRIBUTE_UPDATED, (REPLAY_NODE_ID, path, value))
+        handler_times.append(time.perf_counter() - start)
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    for offset, path, value in gesture.reports:
+        loop.call_at(start + offset, report, path, value)
+    await asyncio.sleep(gesture.reports[-1][0] + SETTLE_SECONDS)
+    for task in tuple(hass.tasks):
+        task.cancel()
+    await asyncio.gather(*hass.tasks, return_exceptions=True)
+
+    calls = [
+        ReplayServiceCall(
+            call.at - start, call.service, call.service_data, call.flash
+        )
+        for call in hass.services.calls
+    ]
+    return GestureResult(gesture, calls, handler_times)
+
+
+def replay_gesture(
+    settings: ReplaySettings,
+    gesture: Gesture,
+    service_latency: float = SERVICE_LATENCY_SECONDS,
+) -> GestureResult:
+    """Replay a gesture on a virtual clock."""
+    clock = VirtualClock()
+    loop = VirtualClockEventLoop(clock)
+    hass = ReplayHass(clock, service_latency)
+    try:
+        with replay_environment(clock, settings):
+            return loop.run_until_complete(_async_replay(hass, settings, gesture))
+    finally:
+        loop.close()
+
+
+def load_gesture(path: Path, node_id: int | None = None) -> Gesture:
+    """Load the dimmer reports of a recorded event stream (JSON lines).
+
+    Without a node id the node of the first OnOff or LevelControl report is used.
+    """
+    reports: list[tuple[float, str, object]] = []
+    for line in path.read_text().splitlines():
+        if not line.strip():
+            continue
+        raw = json.loads(line)
+        if EventType(raw["event"]) != EventType.ATTRIBUTE_UPDATED:
+            continue
+        event_node_id, attribute_path, value = raw["data"]
+        if attribute_path not in (ONOFF, LEVEL):
+            continue
+        if node_id is None:
+            node_id = event_node_id
+        if event_node_id == node_id:
+            reports.append((float(raw["timestamp"]), attribute_path, value))
+    if not reports:
+        raise ValueError(f"No dimmer reports in {path}")
+    first = reports[0][0]
+    return Gesture(
+        path.name,
+        tuple(
+            (timestamp - first, attribute_path, value)
+            for timestamp, attribute_path, value in reports
+        ),
+        decisive_report=None,
+    )
+
+
+def _format_calls(calls: Iterable[ReplayServiceCall]) -> str:
+    """Return the number of calls per service, the focus flash apart."""
+    counts = Counter(
+        f"{call.service} (flash)" if call.flash else call.service for call in calls
+    )
+    return ", ".join(f"{service} x{count}" for service, count in counts.items())
+
+
+def run_replays(
+    settings_grid: Iterable[ReplaySettings],
+    gestures: list[Gesture],
+    service_latency: float,
+) -> None:
+    """Replay all gestures for all settings and print the outcomes."""
+    passing: list[tuple[float, ReplaySettings]] = []
+    for settings in settings_grid:
+        print(f"== {settings}")
+        latencies: list[float] = []
+        regressions = 0
+        for gesture in gestures:
+            result = replay_gesture(settings, gesture, service_latency)
+            if result.passed is False:
+                regressions += 1
+            if result.decision_latency is not None:
+                latencies.append(result.decision_latency)
+            outcome = {True: "ok", False: "REGRESSION", None: "recorded"}[
+                result.passed
+            ]
+            decision = (
+                f"{result.decision_latency * 1000:.0f} ms"
+                if result.decision_latency is not None
+                else "-"
+            )
+            print(
+                f"{gesture.name}: {outcome}, decision {decision},"
+                f" {_format_calls(result.calls) or 'no calls'},"
+                f" handler {statistics.mean(result.handler_times) * 1e6:.1f} us"
+                "/report"
+            )
+        if not regressions and latencies:
+            passing.append((statistics.mean(latencies), settings))
+    if passing:
+        mean_latency, settings = min(passing, key=lambda item: item[0])
+        print(
+            f"fastest without regressions: {settings}"
+            f" (mean decision {mean_latency * 1000:.0f} ms)"
+        )
+    else:
+        print("no settings without regressions")
+
+
+def main() -> None:
+    """Run the gesture replay bench."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", nargs="+", type=Path, default=[])
+    parser.add_argument("--node-id", type=int)
+    parser.add_argument(
+        "--double-tap-window",
+        nargs="+",
+        type=float,
+        default=[DEFAULT_SETTINGS.double_tap_window],
+    )
+    parser.add_argument(
+        "--debounce", nargs="+", type=float, default=[DEFAULT_SETTINGS.debounce]
+    )
+    parser.add_argument(
+        "--hold-window",
+        nargs="+",
+        type=float,
+        default=[DEFAULT_SETTINGS.hold_window],
+    )
+    parser.add_argument(
+        "--hold-min-updates",
+        nargs="+",
+        type=int,
+        default=[DEFAULT_SETTINGS.hold_min_updates],
+    )
+    parser.add_argument(
+        "--service-latency", type=float, default=SERVICE_LATENCY_SECONDS
+    )
+    args = parser.parse_args()
+
+    gestures = [
+        *SYNTHETIC_GESTURES,
+        *(load_gesture(path, args.node_id) for path in args.events),
+    ]
+    settings_grid = [
+        ReplaySettings(*values)
+        for values in itertools.product(
+            args.double_tap_window,
+            args.debounce,
+            args.hold_window,
+            args.hold_min_updates,
+        )
+    ]
+    start = time.perf_counter()
+    run_replays(settings_grid, gestures, args.service_latency)
+    print(
+        f"replayed {len(gestures)} gestures x {len(settings_grid)} settings"
+        f" in {(time.perf_counter() - start) * 1000:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,522 @@
+#!/usr/bin/env python3
+"""Replay recorded Matter fabrics against matter_custom without a Matter server.
+
+Node dumps are read from a Matter config entry diagnostics download
+(the dataclass_to_dict format of the server diagnostics), optionally
+followed by a recorded event stream in JSON lines format:
+
+    {"timestamp": 0.125, "event": "attribute_updated", "data": [5, "1/6/0", true]}
+
+Usage:
+
+    python matter_fabric_replay.py DUMP.json [DUMP.json ...] \
+        [--events STREAM.jsonl] [--nodes 10 100 1000] [--events-per-node 50]
+
+Run from the directory containing the matter_custom package.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+import gc
+import importlib.util
+import json
+from pathlib import Path
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+from matter_server.client.models.node import MatterNode
+from matter_server.common.helpers.util import dataclass_from_dict
+from matter_server.common.models import (
+    EventType,
+    MatterNodeData,
+    MatterNodeEvent,
+    ServerInfoMessage,
+)
+
+from matter_custom import discovery
+from matter_custom.adapter import MatterAdapter
+from matter_custom.discovery import async_discover_entities, iter_schemas
+from matter_custom.entity import MatterEntity
+from matter_custom.sensor import MatterSensor
+
+SUB_WILDCARD = "*"
+# the heavy dependencies, imported before timing the integration imports
+IMPORT_BENCH_PRELOAD = (
+    "import chip.clusters.Objects, homeassistant.core, matter_server.client"
+)
+IMPORT_BENCH_SNIPPETS = {
+    "integration": "import matter_custom",
+    "discovery metadata": "import matter_custom.discovery",
+    "all platforms": (
+        "from matter_custom import discovery; discovery.load_platforms()"
+    ),
+}
+
+
+@dataclass
+class ReplayEvent:
+    """One recorded event of an event stream."""
+
+    timestamp: float
+    event: EventType
+    data: Any
+
+
+class ReplayMatterClient:
+    """Local stand-in for MatterClient, backed by recorded node dumps.
+
+    Implements the part of the MatterClient API used by matter_custom,
+    with the same event subscription (filter) semantics as the real client.
+    Commands and attribute writes are recorded instead of sent.
+    """
+
+    def __init__(
+        self, server_info: ServerInfoMessage, nodes: Iterable[MatterNode]
+    ) -> None:
+        """Initialize the client."""
+        self.server_info = server_info
+        self._nodes: dict[int, MatterNode] = {node.node_id: node for node in nodes}
+        self._subscribers: dict[str, list[Callable]] = {}
+        self.sent_commands: list[tuple[int, int, Any]] = []
+        self.written_attributes: list[tuple[int, str, Any]] = []
+
+    def get_nodes(self) -> list[MatterNode]:
+        """Return all nodes."""
+        return list(self._nodes.values())
+
+    def get_node(self, node_id: int) -> MatterNode:
+        """Return a node, raises KeyError if it does not exist."""
+        return self._nodes[node_id]
+
+    def subscribe_events(
+        self,
+        callback: Callable[[EventType, Any], None],
+        event_filter: EventType | None = None,
+        node_filter: int | None = None,
+        attr_path_filter: str | None = None,
+    ) -> Callable[[], None]:
+        """Subscribe to events, optionally filtered on event, node and path."""
+        key = (
+            f"{SUB_WILDCARD if event_filter is None else event_filter.value}/"
+            f"{SUB_WILDCARD if node_filter is None else node_filter}/"
+            f"{SUB_WILDCARD if attr_path_filter is None else attr_path_filter}"
+        )
+        self._subscribers.setdefault(key, []).append(callback)
+
+        def unsubscribe() -> None:
+            self._subscribers[key].remove(callback)
+
+        return unsubscribe
+
+    async def send_device_command(
+        self, node_id: int, endpoint_id: int, command: Any, **kwargs: Any
+    ) -> None:
+        """Record a device command."""
+        self.sent_commands.append((node_id, endpoint_id, command))
+
+    async def write_attribute(
+        self, node_id: int, attribute_path: str, value: Any
+    ) -> None:
+        """Record an attribute write."""
+        self.written_attributes.append((node_id, attribute_path, value))
+
+    def apply_event(self, replay_event: ReplayEvent) -> None:
+        """Apply a recorded event to the nodes and signal the subscribers."""
+        event, data = replay_event.event, replay_event.data
+        if event == EventType.ATTRIBUTE_UPDATED:
+            node_id, attribute_path, value = data
+            self._nodes[node_id].update_attribute(attribute_path, value)
+            self._signal_event(event, tuple(data), node_id, attribute_path)
+        elif event == EventType.NODE_EVENT:
+            node_event = dataclass_from_dict(MatterNodeEvent, data)
+            self._signal_event(event, node_event, node_event.node_id)
+        elif event in (EventType.NODE_ADDED, EventType.NODE_UPDATED):
+            node_data = dataclass_from_dict(MatterNodeData, data)
+            if (node := self._nodes.get(node_data.node_id)) is None:
+                node = self._nodes[node_data.node_id] = MatterNode(node_data)
+            else:
+                node.update(node_data)
+            self._signal_event(event, node, node.node_id)
+        elif event == EventType.NODE_REMOVED:
+            self._nodes.pop(data, None)
+            self._signal_event(event, data, data)
+        else:
+            self._signal_event(event, data)
+
+    async def replay(self, events: Iterable[ReplayEvent], speed: float = 1.0) -> None:
+        """Replay events at their recorded pace (speed 0 is as fast as possible)."""
+        start = time.monotonic()
+        for replay_event in events:
+            if speed and (
+                delay := replay_event.timestamp / speed - (time.monotonic() - start)
+            ) > 0:
+                await asyncio.sleep(delay)
+            self.apply_event(replay_event)
+
+    def _signal_event(
+        self,
+        event: EventType,
+        data: Any = None,
+        node_id: int | None = None,
+        attribute_path: str | None = None,
+    ) -> None:
+        """Forward an event to the matching subscribers."""
+        for event_key in (event.value, SUB_WILDCARD):
+            for node_key in (node_id, SUB_WILDCARD):
+                if node_key is None:
+                    continue
+                for path_key in (attribute_path, SUB_WILDCARD):
+                    if path_key is None:
+                        continue
+                    key = f"{event_key}/{node_key}/{path_key}"
+                    for callback in tuple(self._subscribers.get(key, ())):
+                        callback(event, data)
+
+
+def load_dump(path: Path) -> tuple[ServerInfoMessage, list[dict[str, Any]]]:
+    """Load server info and raw node data from a diagnostics download."""
+    dump = json.loads(path.read_text())
+    # the diagnostics download wraps the integration data in "data"
+    server = dump.get("data", dump)["server"]
+    return dataclass_from_dict(ServerInfoMessage, server["info"]), server["nodes"]
+
+
+def load_events(path: Path) -> list[ReplayEvent]:
+    """Load a recorded event stream (JSON lines)."""
+    return [
+        ReplayEvent(
+            timestamp=float(raw["timestamp"]),
+            event=EventType(raw["event"]),
+            data=raw["data"],
+        )
+        for line in path.read_text().splitlines()
+        if line.strip() and (raw := json.loads(line))
+    ]
+
+
+def build_fabric(
+    server_info: ServerInfoMessage, templates: list[dict[str, Any]], size: int
+) -> ReplayMatterClient:
+    """Build a synthetic fabric of the given size by cloning the template nodes."""
+    nodes: list[MatterNode] = []
+    for node_id in range(1, size + 1):
+        node_dict = dict(templates[(node_id - 1) % len(templates)])
+        node_dict["node_id"] = node_id
+        nodes.append(MatterNode(dataclass_from_dict(MatterNodeData, node_dict)))
+    return ReplayMatterClient(server_info, nodes)
+
+
+def synthetic_events(
+    entities: list[MatterEntity], count: int, seed: int = 1
+) -> list[ReplayEvent]:
+    """Generate attribute reports for attributes watched by the entities."""
+    rnd = random.Random(seed)
+    watched = {
+        (
+            entity._endpoint.node.node_id,
+            entity.get_matter_attribute_path(attribute),
+        ): (entity._endpoint, attribute)
+        for entity in entities
+        for attribute in entity._entity_info.attributes_to_watch
+    }
+    paths = sorted(watched)
+    events: list[ReplayEvent] = []
+    for index in range(count):
+        node_id, attribute_path = rnd.choice(paths)
+        endpoint, attribute = watched[node_id, attribute_path]
+        value = current = endpoint.get_attribute_value(None, attribute)
+        if isinstance(current, bool):
+            value = not current
+        elif isinstance(current, int):
+            value = current + rnd.choice((-1, 1))
+        events.append(
+            ReplayEvent(
+                timestamp=index / 1000,
+                event=EventType.ATTRIBUTE_UPDATED,
+                data=(node_id, attribute_path, value),
+            )
+        )
+    return events
+
+
+def _iter_linear_schemas(endpoint: Any) -> Iterable[Any]:
+    """Iterate all schemas for the endpoint like discovery did before the index."""
+    for schema in iter_schemas():
+        if endpoint.has_attribute(None, schema.required_attributes[0]):
+            yield schema
+
+
+def bench_discovery(client: ReplayMatterClient) -> dict[str, float]:
+    """Measure discovery time over all endpoints, linear walk vs discovery index."""
+    endpoints = [
+        endpoint for node in client.get_nodes() for endpoint in node.endpoints.values()
+    ]
+    results: dict[str, float] = {}
+    indexed = discovery.iter_endpoint_schemas
+    for mode, schema_iterator in (
+        ("linear", _iter_linear_schemas),
+        ("indexed", indexed),
+    ):
+        discovery.iter_endpoint_schemas = schema_iterator
+        try:
+            start = time.perf_counter()
+            for endpoint in endpoints:
+                list(async_discover_entities(endpoint))
+            results[mode] = time.perf_counter() - start
+        finally:
+            discovery.iter_endpoint_schemas = indexed
+    return results
+
+
+def create_entities(client: ReplayMatterClient) -> tuple[list[MatterEntity], list[float]]:
+    """Run discovery and create the entities of all nodes.
+
+    Returns the entities and the setup time of each node.
+    """
+    entities: list[MatterEntity] = []
+    node_times: list[float] = []
+    for node in client.get_nodes():
+        start = time.perf_counter()
+        for endpoint in node.endpoints.values():
+            entities.extend(
+                entity_info.entity_class(client, endpoint, entity_info)
+                for entity_info in async_discover_entities(endpoint)
+            )
+        node_times.append(time.perf_counter() - start)
+    return entities, node_times
+
+
+def bench_memory(client: ReplayMatterClient) -> dict[str, float]:
+    """Measure the memory allocated per created entity, in total and per platform.
+
+    The total includes the discovery (entity info) of the entities,
+    the per platform numbers only the entity instances.
+    """
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    entity_infos = [
+        entity_info
+        for node in client.get_nodes()
+        for endpoint in node.endpoints.values()
+        for entity_info in async_discover_entities(endpoint)
+    ]
+    platform_infos: dict[str, list[Any]] = {}
+    for entity_info in entity_infos:
+        platform_infos.setdefault(entity_info.platform, []).append(entity_info)
+    entities: list[MatterEntity] = []
+    results: dict[str, float] = {"entities": len(entity_infos)}
+    for platform, infos in platform_infos.items():
+        before, _ = tracemalloc.get_traced_memory()
+        entities.extend(
+            entity_info.entity_class(client, entity_info.endpoint, entity_info)
+            for entity_info in infos
+        )
+        after, _ = tracemalloc.get_traced_memory()
+        results[f"bytes_per_entity_{platform}"] = (after - before) / len(infos)
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    results["bytes_per_entity"] = (end - start) / len(entities) if entities else 0.0
+    return results
+
+
+def bench_sensor_updates(
+    entities: list[MatterEntity], updates: int = 1000
+) -> dict[str, float]:
+    """Measure the CPU time per state update of the energy/power sensors."""
+    sensors = [
+        entity
+        for entity in entities
+        if isinstance(entity, MatterSensor)
+        and entity.entity_description.device_class in ("energy", "power")
+    ]
+    if not sensors:
+        return {"sensors": 0}
+    start = time.process_time()
+    for _ in range(updates):
+        for sensor in sensors:
+            sensor._update_from_device()
+    elapsed = time.process_time() - start
+    return {
+        "sensors": len(sensors),
+        "us_per_update": elapsed / (updates * len(sensors)) * 1_000_000,
+    }
+
+
+def bench_dispatch(
+    client: ReplayMatterClient, entities: list[MatterEntity], events: list[ReplayEvent]
+) -> dict[str, float]:
+    """Measure attribute event dispatch throughput, client filters vs adapter router.
+
+    Each entity watched attribute gets a counting callback, so only
+    the event routing is measured (not the entity state updates).
+    """
+    results: dict[str, float] = {}
+    received = 0
+
+    def on_event(event: EventType, data: Any) -> None:
+        nonlocal received
+        received += 1
+
+    watched = [
+        (entity._endpoint.node.node_id, entity.get_matter_attribute_path(attribute))
+        for entity in entities
+        for attribute in entity._entity_info.attributes_to_watch
+    ]
+
+    # one client subscription per watched attribute path
+    unsubscribes = [
+        client.subscribe_events(
+            callback=on_event,
+            event_filter=EventType.ATTRIBUTE_UPDATED,
+            node_filter=node_id,
+            attr_path_filter=attribute_path,
+        )
+        for node_id, attribute_path in watched
+    ]
+    start = time.perf_counter()
+    for replay_event in events:
+        client.apply_event(replay_event)
+    results["client_events_per_sec"] = len(events) / (time.perf_counter() - start)
+    for unsubscribe in unsubscribes:
+        unsubscribe()
+
+    # a single client subscription routed by the adapter
+    adapter = MatterAdapter(None, client, None)  # type: ignore[arg-type]
+    unsubscribes = [
+        client.subscribe_events(
+            callback=adapter._on_attribute_updated,
+            event_filter=EventType.ATTRIBUTE_UPDATED,
+        )
+    ]
+    unsubscribes.extend(
+        adapter.subscribe_attribute_events(on_event, node_id, attribute_path)
+        for node_id, attribute_path in watched
+    )
+    start = time.perf_counter()
+    for replay_event in events:
+        client.apply_event(replay_event)
+    results["adapter_events_per_sec"] = len(events) / (time.perf_counter() - start)
+    for unsubscribe in unsubscribes:
+        unsubscribe()
+
+    results["callbacks"] = received
+    return results
+
+
+def bench_import(repeat: int = 5) -> dict[str, float]:
+    """Measure the import time of the integration, in fresh interpreters.
+
+    Returns the median time per snippet, excluding the (preloaded)
+    Home Assistant, CHIP and Matter server dependencies.
+    """
+    results: dict[str, float] = {}
+    for name, snippet in IMPORT_BENCH_SNIPPETS.items():
+        code = (
+            f"{IMPORT_BENCH_PRELOAD}; import time; start = time.perf_counter();"
+            f" {snippet}; print(time.perf_counter() - start)"
+        )
+        results[name] = statistics.median(
+            float(
+                subprocess.run(
+                    [sys.executable, "-c", code],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                    cwd=Path(__file__).parent,
+                ).stdout
+            )
+            for _ in range(repeat)
+        )
+    return results
+
+
+def run_benchmarks(
+    server_info: ServerInfoMessage,
+    templates: list[dict[str, Any]],
+    sizes: list[int],
+    events_per_node: int,
+    recorded_events: list[ReplayEvent] | None,
+) -> None:
+    """Run the benchmark suite for each fabric size and print the results."""
+    for name, seconds in bench_import().items():
+        print(f"import ({name}): {seconds * 1000:.1f} ms")
+    # all platforms present in the tree, failing on an outdated PLATFORM_CLUSTERS
+    discovery.load_platforms(
+        platform
+        for platform in discovery.SUPPORTED_PLATFORMS
+        if importlib.util.find_spec(f"matter_custom.{platform}") is not None
+    )
+    discovery.check_platform_clusters()
+    for size in sizes:
+        client = build_fabric(server_info, templates, size)
+        print(f"== fabric with {size} nodes")
+        for mode, seconds in bench_discovery(client).items():
+            print(f"discovery ({mode}): {seconds * 1000:.1f} ms")
+        entities, node_times = create_entities(client)
+        print(
+            f"setup per node: mean {statistics.mean(node_times) * 1000:.2f} ms,"
+            f" max {max(node_times) * 1000:.2f} ms ({len(entities)} entities)"
+        )
+        events = (
+            recorded_events
+            if recorded_events is not None and size == len(templates)
+            else synthetic_events(entities, events_per_node * size)
+        )
+        for key, value in bench_dispatch(client, entities, events).items():
+            print(f"dispatch {key}: {value:,.0f}")
+        for key, value in bench_sensor_updates(entities).items():
+            print(f"energy/power sensor {key}: {value:,.2f}")
+        for key, value in bench_memory(build_fabric(server_info, templates, size)).items():
+            print(f"memory {key}: {value:,.0f}")
+
+
+def main() -> None:
+    """Run the replay benchmark suite."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("dumps", nargs="+", type=Path)
+    parser.add_argument("--events", type=Path)
+    parser.add_argument("--nodes", nargs="+", type=int, default=[10, 100, 1000])
+    parser.add_argument("--events-per-node", type=int, default=50)
+    args = parser.parse_args()
+
+    server_info: ServerInfoMessage | None = None
+    templates: list[dict[str, Any]] = []
+    for dump in args.dumps:
+        dump_server_info, nodes = load_dump(dump)
+        server_info = server_info or dump_server_info
+        templates.extend(nodes)
+    assert server_info is not None
+
+    recorded_events = load_events(args.events) if args.events else None
+    if recorded_events is not None:
+        # replay the recorded stream against the recorded fabric itself
+        client = ReplayMatterClient(
+            server_info,
+            [
+                MatterNode(dataclass_from_dict(MatterNodeData, node))
+                for node in templates
+            ],
+        )
+        start = time.perf_counter()
+        asyncio.run(client.replay(recorded_events, speed=0))
+        print(
+            f"replayed {len(recorded_events)} recorded events"
+            f" in {(time.perf_counter() - start) * 1000:.1f} ms"
+        )
+    run_benchmarks(
+        server_info, templates, args.nodes, args.events_per_node, recorded_events
+    )
+
+
+if __name__ == "__main__":
+    main()
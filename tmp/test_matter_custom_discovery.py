@@ -0,0 +1,35 @@
+"""Tests for the discovery metadata of matter_custom.
+
+Run from the directory containing the matter_custom package.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+
+import pytest
+
+from homeassistant.const import Platform
+
+from matter_custom import discovery
+
+
+@pytest.mark.parametrize("platform", discovery.SUPPORTED_PLATFORMS)
+def test_platform_clusters_match_the_schemas(platform: Platform) -> None:
+    """Test PLATFORM_CLUSTERS lists exactly the primary clusters of the schemas.
+
+    An unlisted cluster means the platform is not loaded for endpoints which
+    only have that cluster, so their entities silently disappear.
+    A listed cluster without schema loads the platform for nothing.
+    """
+    if importlib.util.find_spec(f"matter_custom.{platform}") is None:
+        pytest.skip(f"platform {platform} is not part of this tree")
+    discovery.load_platforms([platform])
+    schema_cluster_ids = {
+        schema.required_attributes[0].cluster_id
+        for schema in discovery.DISCOVERY_SCHEMAS[platform]
+    }
+    listed_cluster_ids = {
+        cluster.id for cluster in discovery.PLATFORM_CLUSTERS[platform]
+    }
+    assert listed_cluster_ids == schema_cluster_ids
@@ -0,0 +1,98 @@
+"""Tests for the command helpers of matter_custom.
+
+Run from the directory containing the matter_custom package.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Coroutine
+from typing import Any
+
+from matter_custom.helpers import async_send_device_commands
+
+
+class FakeEntity:
+    """Entity of which the device only responds to a command when told to."""
+
+    def __init__(self, entity_id: str = "light.fake") -> None:
+        """Initialize the fake entity."""
+        self.entity_id = entity_id
+        self.log: list[str] = []
+        self._responses: dict[str, asyncio.Event] = {}
+
+    async def send_device_command(self, command: str) -> None:
+        """Send the command and wait for the response of the device."""
+        self.log.append(f"send {command}")
+        await self._responses.setdefault(command, asyncio.Event()).wait()
+        self.log.append(f"response {command}")
+
+    def respond(self, command: str) -> None:
+        """Let the device respond to the command."""
+        self._responses.setdefault(command, asyncio.Event()).set()
+
+
+async def _settle() -> None:
+    """Let the pending tasks run until they wait for a response."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def _run(coro: Coroutine[Any, Any, None]) -> None:
+    asyncio.run(coro)
+
+
+def test_commands_wait_for_the_previous_response() -> None:
+    """Test a command is only sent once the previous one got its response."""
+
+    async def run() -> None:
+        entity = FakeEntity()
+        task = asyncio.create_task(
+            async_send_device_commands(entity, ["color", "level"])
+        )
+        await _settle()
+        assert entity.log == ["send color"]
+        entity.respond("color")
+        await _settle()
+        assert entity.log == ["send color", "response color", "send level"]
+        entity.respond("level")
+        await task
+        assert entity.log[-1] == "response level"
+
+    _run(run())
+
+
+def test_pipelined_commands_are_sent_at_once_in_order() -> None:
+    """Test pipelined commands do not wait for the previous response."""
+
+    async def run() -> None:
+        entity = FakeEntity()
+        task = asyncio.create_task(
+            async_send_device_commands(entity, ["color", "level"], pipelined=True)
+        )
+        await _settle()
+        assert entity.log == ["send color", "send level"]
+        entity.respond("level")
+        entity.respond("color")
+        await task
+
+    _run(run())
+
+
+def test_calls_are_not_batched() -> None:
+    """Test concurrent calls send their commands right away, independently."""
+
+    async def run() -> None:
+        slow, fast = FakeEntity("light.slow"), FakeEntity("light.fast")
+        slow_task = asyncio.create_task(async_send_device_commands(slow, ["on"]))
+        fast_task = asyncio.create_task(async_send_device_commands(fast, ["on"]))
+        await _settle()
+        assert slow.log == ["send on"]
+        assert fast.log == ["send on"]
+        fast.respond("on")
+        await fast_task
+        assert not slow_task.done()
+        slow.respond("on")
+        await slow_task
+
+    _run(run())
@@ -0,0 +1,109 @@
+"""Tests for the command pipelining of the matter_custom light.
+
+Run from the directory containing the matter_custom package.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+from homeassistant.components.light import ATTR_BRIGHTNESS, ATTR_HS_COLOR, ColorMode
+
+from matter_custom.const import CONF_COMMAND_PIPELINING, DOMAIN
+from matter_custom.light import MatterLight
+
+COLOR = "MoveToHueAndSaturation"
+LEVEL = "MoveToLevelWithOnOff"
+
+
+class FakeDevice:
+    """Device which only responds to a command when told to."""
+
+    def __init__(self) -> None:
+        """Initialize the fake device."""
+        self.log: list[str] = []
+        self._responses: dict[str, asyncio.Event] = {}
+
+    async def send_device_command(self, command: Any) -> None:
+        """Receive the command and wait until the device responds to it."""
+        name = type(command).__name__
+        self.log.append(f"send {name}")
+        await self._responses.setdefault(name, asyncio.Event()).wait()
+        self.log.append(f"response {name}")
+
+    def respond(self, name: str) -> None:
+        """Let the device respond to the command."""
+        self._responses.setdefault(name, asyncio.Event()).set()
+
+
+def _make_light(
+    options: dict[str, Any], pipelining_disabled: bool = False
+) -> tuple[MatterLight, FakeDevice]:
+    """Return a color light (without Matter node) and its fake device."""
+    device = FakeDevice()
+    config_entry = SimpleNamespace(options=options)
+    entry_data = SimpleNamespace(adapter=SimpleNamespace(config_entry=config_entry))
+    light = MatterLight.__new__(MatterLight)
+    light.hass = SimpleNamespace(data={DOMAIN: {"entry_id": entry_data}})
+    light.entity_id = "light.fake"
+    light._attr_supported_color_modes = {ColorMode.HS}
+    light._supports_brightness = True
+    light._pipelining_disabled = pipelining_disabled
+    light._endpoint = SimpleNamespace(
+        get_cluster=lambda cluster: SimpleNamespace(minLevel=1, maxLevel=254)
+    )
+    light.send_device_command = device.send_device_command
+    return light, device
+
+
+async def _settle() -> None:
+    """Let the pending tasks run until they wait for a response."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def _turn_on_in_order(light: MatterLight, device: FakeDevice) -> None:
+    """Assert the level command is only sent after the color command response."""
+    task = asyncio.create_task(
+        light.async_turn_on(**{ATTR_HS_COLOR: (30, 50), ATTR_BRIGHTNESS: 128})
+    )
+    await _settle()
+    assert device.log == [f"send {COLOR}"]
+    device.respond(COLOR)
+    await _settle()
+    assert device.log == [f"send {COLOR}", f"response {COLOR}", f"send {LEVEL}"]
+    device.respond(LEVEL)
+    await task
+
+
+def test_commands_in_order_by_default() -> None:
+    """Test pipelining is opt-in: by default commands wait for the response."""
+    asyncio.run(_turn_on_in_order(*_make_light({})))
+
+
+def test_commands_in_order_when_pipelining_disabled() -> None:
+    """Test a light with pipelining disabled keeps the command order."""
+    asyncio.run(
+        _turn_on_in_order(
+            *_make_light({CONF_COMMAND_PIPELINING: True}, pipelining_disabled=True)
+        )
+    )
+
+
+def test_commands_pipelined_when_enabled() -> None:
+    """Test the commands are sent at once when pipelining is enabled."""
+
+    async def run() -> None:
+        light, device = _make_light({CONF_COMMAND_PIPELINING: True})
+        task = asyncio.create_task(
+            light.async_turn_on(**{ATTR_HS_COLOR: (30, 50), ATTR_BRIGHTNESS: 128})
+        )
+        await _settle()
+        assert device.log == [f"send {COLOR}", f"send {LEVEL}"]
+        device.respond(COLOR)
+        device.respond(LEVEL)
+        await task
+
+    asyncio.run(run())
@@ -0,0 +1,24 @@
+"""Tests for the dimmer gesture replay bench.
+
+Run from the directory containing matter_dimmer_bridge_live.py.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from matter_dimmer_gesture_replay import (
+    DEFAULT_SETTINGS,
+    SYNTHETIC_GESTURES,
+    Gesture,
+    _format_calls,
+    replay_gesture,
+)
+
+
+@pytest.mark.parametrize("gesture", SYNTHETIC_GESTURES, ids=lambda g: g.name)
+def test_synthetic_gestures_pass_with_default_settings(gesture: Gesture) -> None:
+    """Test the bridge makes the expected decision for every synthetic gesture."""
+    result = replay_gesture(DEFAULT_SETTINGS, gesture)
+    assert result.passed, _format_calls(result.calls)
+    assert result.decision_latency is not None